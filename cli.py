@@ -0,0 +1,175 @@
+"""
+Command line interface of the framework.
+
+Subcommands:
+    generate    create batch files from the Homberger instances
+    run         run an optimizer on batch files and print the evaluation
+    sweep       compare several fleets on one batch file
+    bench       measure startup and the main stages of the framework
+
+Only a few standard library modules are imported up front; every subcommand
+imports what it needs, so short runs and worker processes do not pay for
+unused modules.
+"""
+import os
+import sys
+import json
+import argparse
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_OPTIMIZER = 'optimization.round_robin:RoundRobin'
+
+
+def load_optimizer(spec: str):
+    """
+    Imports an optimizer class given as 'module:Class'.
+
+    Args:
+        spec (str): The module path and class name, separated by a colon.
+
+    Returns:
+        The optimizer class.
+    """
+    import importlib
+
+    module_name, _, class_name = spec.partition(':')
+    if not class_name:
+        raise ValueError(
+            f"Optimizer '{spec}' must have the form module:Class.")
+
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def configure_paths(root: str):
+    """
+    Points all dataset and cache folders to the given repository folder.
+
+    Args:
+        root (str): The repository folder.
+    """
+    from framework.data_input import DataInput
+    from framework.result_cache import ResultCache
+
+    DataInput.DATASETS_PATH = os.path.join(root, 'datasets')
+    DataInput.GRAPHS_CACHE_PATH = os.path.join(root, '.cache', 'graphs')
+    ResultCache.CACHE_PATH = os.path.join(root, '.cache', 'results')
+
+
+def command_generate(args):
+    from generator.generator import Generator
+
+    batch_sizes = [None if size == 'none' else int(size) for size in args.batch_sizes]
+    for tasks in args.tasks:
+        for batch_size in batch_sizes:
+            Generator(tasks=tasks, batch_size=batch_size, root=args.root)
+
+
+def command_run(args):
+    configure_paths(args.root)
+
+    from framework.data_input import DataInput
+    from framework.result_cache import ResultCache
+    from main import execute
+
+    OptimizerImpl = load_optimizer(args.optimizer)
+    result_cache = None if args.no_cache else ResultCache()
+
+    batch_files = args.batch
+    if not batch_files:
+        batch_path = os.path.join(DataInput.DATASETS_PATH, DataInput.BATCHES_FOLDER)
+        batch_files = sorted(os.listdir(batch_path))
+
+    for batch_file in batch_files:
+        evaluation = execute(batch_file, args.amrs, OptimizerImpl, args.params,
+                             result_cache, args.graph)
+
+        print("\n\nFile ", batch_file)
+        print(evaluation)
+
+
+def command_sweep(args):
+    configure_paths(args.root)
+
+    from framework.fleet_sweep import FleetSweep
+
+    OptimizerImpl = load_optimizer(args.optimizer)
+
+    fleet_sweep = FleetSweep(args.batch, args.amrs, OptimizerImpl, args.params, args.graph)
+    fleet_sweep.run(args.processes)
+    print(fleet_sweep)
+
+
+def command_bench(args):
+    configure_paths(args.root)
+
+    from framework.benchmark import Benchmark
+
+    OptimizerImpl = load_optimizer(args.optimizer) if args.optimizer else None
+
+    benchmark = Benchmark(args.repeat)
+    benchmark.run(args.batch, args.amrs, OptimizerImpl)
+    print(benchmark)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--root', default=ROOT,
+                        help='folder containing datasets/, generator/ and .cache/ (default: %(default)s)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help='create batch files from the Homberger instances')
+    generate.add_argument('--tasks', type=int, nargs='+', default=[100],
+                          help='number of tasks per file (100, 200, 300, 400 or 500)')
+    generate.add_argument('--batch-sizes', nargs='+', default=['none'],
+                          help="tasks per batch, 'none' for a single batch")
+    generate.set_defaults(handler=command_generate)
+
+    optimizer_arguments = argparse.ArgumentParser(add_help=False)
+    optimizer_arguments.add_argument('--optimizer', default=DEFAULT_OPTIMIZER,
+                                     help='optimizer class as module:Class (default: %(default)s)')
+    optimizer_arguments.add_argument('--params', type=json.loads, default={},
+                                     help='optimizer keyword arguments as a JSON object')
+    optimizer_arguments.add_argument('--graph', default=None,
+                                     help='warehouse graph file in datasets/graphs')
+
+    run = subparsers.add_parser('run', parents=[optimizer_arguments],
+                                help='run an optimizer on batch files')
+    run.add_argument('--batch', nargs='*', default=None,
+                     help='batch files in datasets/batches (default: all)')
+    run.add_argument('--amrs', default='amrs_15.json', help='AMR file in datasets/amrs')
+    run.add_argument('--no-cache', action='store_true', help='do not use the result cache')
+    run.set_defaults(handler=command_run)
+
+    sweep = subparsers.add_parser('sweep', parents=[optimizer_arguments],
+                                  help='compare several fleets on one batch file')
+    sweep.add_argument('--batch', required=True, help='batch file in datasets/batches')
+    sweep.add_argument('--amrs', nargs='+',
+                       default=['amrs_15.json', 'amrs_30.json', 'amrs_60.json', 'amrs_120.json'],
+                       help='AMR files in datasets/amrs')
+    sweep.add_argument('--processes', type=int, default=None,
+                       help='number of worker processes (default: number of CPUs)')
+    sweep.set_defaults(handler=command_sweep)
+
+    bench = subparsers.add_parser('bench', help='measure startup and the main stages')
+    bench.add_argument('--batch', default='tasks_100_batchsize_None_C1_2_1.json',
+                       help='batch file in datasets/batches')
+    bench.add_argument('--amrs', default='amrs_15.json', help='AMR file in datasets/amrs')
+    bench.add_argument('--optimizer', default=None,
+                       help='optimizer class as module:Class; stages needing a schedule are skipped without')
+    bench.add_argument('--repeat', type=int, default=5, help='runs per stage, the fastest is reported')
+    bench.set_defaults(handler=command_bench)
+
+    return parser
+
+
+if __name__ == "__main__":
+
+    args = create_parser().parse_args()
+
+    # the optimizer module may live in the repository folder
+    if args.root not in sys.path:
+        sys.path.insert(0, args.root)
+
+    args.handler(args)
@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+from typing import Callable, Dict, List
+
+
+class Benchmark:
+    """
+    Measures startup and the main stages of the framework.
+
+    Startup is measured in fresh interpreters started from the folder the
+    framework code lives in: the CLI help and the import of the modules worker
+    processes need. The other stages run in the current process on one batch
+    file, read from DataInput.DATASETS_PATH. Stages that need a schedule only
+    run if an optimizer is given. Every stage is repeated and the fastest run
+    is kept.
+
+    Attributes:
+        repeat (int): How often each stage is run.
+        timings (Dict[str, float]): The fastest time of each stage in seconds.
+    """
+
+    # the folder containing cli.py and the framework packages
+    CODE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # modules worker processes import before they can take work
+    WORKER_MODULES = ['framework.warehouse_graph', 'framework.fleet_sweep']
+
+    def __init__(self, repeat: int = 5):
+        """
+        Initializes the Benchmark object.
+
+        Args:
+            repeat (int): How often each stage is run.
+        """
+        self.repeat = repeat
+        self.timings: Dict[str, float] = {}
+
+    def run(self, batch_file: str, amr_file: str, OptimizerImpl=None) -> Dict[str, float]:
+        """
+        Runs all stages.
+
+        Args:
+            batch_file (str): The filename of the batch file.
+            amr_file (str): The filename of the AMR file.
+            OptimizerImpl: The optimizer class, or None to skip the stages needing a schedule.
+
+        Returns:
+            Dict[str, float]: The fastest time of each stage in seconds.
+        """
+        from framework.data_input import DataInput
+        from framework.evaluation import Evaluation
+        from framework.lower_bounds import LowerBounds
+        from framework.schedule_io import ScheduleIO
+        from framework.simulation import Simulation
+
+        self.timings = {}
+
+        self._measure('startup: python', self._start(['-c', 'pass']))
+        self._measure('startup: cli --help',
+                      self._start([os.path.join(Benchmark.CODE_ROOT, 'cli.py'), '--help']))
+        for module in Benchmark.WORKER_MODULES:
+            self._measure(f'startup: import {module}',
+                          self._start(['-c', f'import {module}']))
+
+        data_input = DataInput(batch_file, amr_file)
+        self._measure('load data input', lambda: DataInput(batch_file, amr_file))
+        self._measure('lower bounds', lambda: LowerBounds(data_input).total())
+
+        if OptimizerImpl is None:
+            return self.timings
+
+        scheduling_output = OptimizerImpl().run(data_input)
+        self._measure('optimizer run', lambda: OptimizerImpl().run(data_input))
+        self._measure('evaluation', lambda: Evaluation(data_input).evaluate(scheduling_output))
+        self._measure('simulation', lambda: Simulation(data_input).run(scheduling_output))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'schedule.bin')
+            self._measure('schedule write', lambda: ScheduleIO.write_binary(scheduling_output, path))
+            self._measure('schedule read', lambda: ScheduleIO.read_binary(path, data_input))
+            self._measure('stored evaluation', lambda: Evaluation(data_input).evaluate_stored(path))
+
+        return self.timings
+
+    def _start(self, arguments: List[str]) -> Callable[[], None]:
+        command = [sys.executable] + arguments
+        return lambda: subprocess.run(command, cwd=Benchmark.CODE_ROOT, check=True,
+                                      stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+
+    def _measure(self, name: str, stage: Callable[[], object]):
+        fastest = None
+        for _ in range(self.repeat):
+            start_time = time.perf_counter()
+            stage()
+            elapsed = time.perf_counter() - start_time
+            fastest = elapsed if fastest is None else min(fastest, elapsed)
+        self.timings[name] = fastest
+
+    def __str__(self):
+        """
+        Returns a string representation of the Benchmark results.
+
+        Returns:
+            str: String representation of the Benchmark results.
+        """
+        benchmark_str = "Benchmark Results:\n"
+        for name, seconds in self.timings.items():
+            benchmark_str += f"    {name:<45} {seconds * 1000:>10.2f} ms\n"
+        return benchmark_str
@@ -0,0 +1,168 @@
+from array import array
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from model.kinematics import Kinematics
+
+
+Location = Tuple[float, float]
+
+
+class CostCache:
+    """
+    Memoizes travel times and distances between locations.
+
+    Travel times are stored per distance model and motion profile, so AMRs of
+    different types with identical velocity, acceleration and deceleration
+    share their entries, while AMRs routed on different graphs do not.
+    A cache can outlive a single batch, which lets optimizers reuse all costs
+    computed for earlier batches.
+
+    For large instances the cache can be primed with the distances between
+    all origins and destinations of empty legs and of all loaded legs. They
+    are kept in flat float64 arrays, which are cheap to build and to send to
+    other processes, and travel times of primed legs are derived from them on
+    request.
+
+    Attributes:
+        distance_model: Optional model replacing the straight-line distance, see Kinematics.
+    """
+
+    def __init__(self, distance_model=None):
+        """
+        Initializes an empty CostCache.
+
+        Args:
+            distance_model: Optional model with a distance(start_location, end_location) method.
+        """
+        self.distance_model = distance_model
+        self._travel_times: Dict[tuple, Dict[Tuple[Location, Location], float]] = {}
+        self._distances: Dict[Tuple[Location, Location], float] = {}
+
+        self._origin_index: Dict[Location, int] = {}
+        self._destination_index: Dict[Location, int] = {}
+        self._distance_matrix = array('d')
+        self._leg_index: Dict[Tuple[Location, Location], int] = {}
+        self._leg_distances = array('d')
+
+    def travel_time(self, kinematics: Kinematics, start_location: Location, end_location: Location) -> float:
+        """
+        Returns the time to move from start to end with the given kinematics.
+
+        Args:
+            kinematics (Kinematics): The kinematics of the moving AMR.
+            start_location (Tuple[float, float]): The starting location coordinates (x, y).
+            end_location (Tuple[float, float]): The ending location coordinates (x, y).
+
+        Returns:
+            float: The time in seconds.
+        """
+        model_key = CostCache._model_key(kinematics.distance_model)
+        if model_key == CostCache._model_key(self.distance_model):
+            distance = self._primed_distance(start_location, end_location)
+            if distance is not None:
+                return kinematics.calc_time_for_distance(distance)
+
+        profile_key = (model_key, kinematics.motion_profile)
+        table = self._travel_times.get(profile_key)
+        if table is None:
+            table = self._travel_times[profile_key] = {}
+
+        key = (start_location, end_location)
+        time = table.get(key)
+        if time is None:
+            time = table[key] = kinematics.calc_time(start_location, end_location)
+        return time
+
+    def distance(self, start_location: Location, end_location: Location) -> float:
+        """
+        Returns the distance between two locations.
+
+        Args:
+            start_location (Tuple[float, float]): The starting location coordinates (x, y).
+            end_location (Tuple[float, float]): The ending location coordinates (x, y).
+
+        Returns:
+            float: The distance in meters.
+        """
+        distance = self._primed_distance(start_location, end_location)
+        if distance is not None:
+            return distance
+
+        key = (start_location, end_location)
+        distance = self._distances.get(key)
+        if distance is None:
+            if self.distance_model is not None:
+                distance = self.distance_model.distance(start_location, end_location)
+            else:
+                distance = Kinematics.distance(start_location, end_location)
+            self._distances[key] = distance
+        return distance
+
+    def prime(self, origins: Sequence[Location], destinations: Sequence[Location],
+              legs: Iterable[Tuple[Location, Location]] = ()):
+        """
+        Computes the distances between all origins and destinations, and of the given legs, in advance.
+        Travel times of these legs are derived from the distances for every motion profile.
+
+        Args:
+            origins (Sequence[Tuple[float, float]]): The locations legs can start from.
+            destinations (Sequence[Tuple[float, float]]): The locations legs can end at.
+            legs (Iterable[Tuple[Tuple[float, float], Tuple[float, float]]]): Further
+                (start_location, end_location) pairs to compute, e.g. the loaded legs of the tasks.
+        """
+        origin_index = {}
+        for origin in origins:
+            origin_index.setdefault(origin, len(origin_index))
+        destination_index = {}
+        for destination in destinations:
+            destination_index.setdefault(destination, len(destination_index))
+
+        if self.distance_model is not None:
+            measure = self.distance_model.distance
+        else:
+            measure = Kinematics.distance
+
+        distance_matrix = array('d')
+        for origin in origin_index:
+            distance_matrix.extend(map(measure, [origin] * len(destination_index), destination_index))
+
+        leg_index = {}
+        for leg in legs:
+            leg_index.setdefault(leg, len(leg_index))
+        leg_distances = array('d', (measure(start_location, end_location)
+                                    for start_location, end_location in leg_index))
+
+        self._origin_index = origin_index
+        self._destination_index = destination_index
+        self._distance_matrix = distance_matrix
+        self._leg_index = leg_index
+        self._leg_distances = leg_distances
+
+    def _primed_distance(self, start_location: Location, end_location: Location) -> Optional[float]:
+        row = self._origin_index.get(start_location)
+        if row is not None:
+            column = self._destination_index.get(end_location)
+            if column is not None:
+                return self._distance_matrix[row * len(self._destination_index) + column]
+
+        position = self._leg_index.get((start_location, end_location))
+        if position is not None:
+            return self._leg_distances[position]
+        return None
+
+    @staticmethod
+    def _model_key(distance_model):
+        # a graph model is identified by its matrix file, which survives pickling
+        if distance_model is None:
+            return None
+        return getattr(distance_model, 'matrix_path', distance_model)
+
+    def __len__(self):
+        """
+        Returns the number of cached travel times and distances.
+
+        Returns:
+            int: The number of cached entries.
+        """
+        return (len(self._distance_matrix) + len(self._leg_distances) + len(self._distances)
+                + sum(map(len, self._travel_times.values())))
@@ -1,7 +1,8 @@
 import os
+import copy
 import json
 
-from typing import Optional
+from typing import List, Optional
 
 from model.amr import AMR
 from model.time_window import TimeWindow
@@ -9,6 +10,8 @@ from model.batch import Batch
 from model.task import Task
 from model.kinematics import Kinematics
 
+from framework.scheduling_output import SchedulingOutput
+
 
 class DataInput:
     """
@@ -19,36 +22,88 @@ class DataInput:
         amr_file_path (str): The path to the AMR file.
         amrs (List[AMR]): A list of AMRs read from the file.
         batches (List[Batch]): A list of Batches read from the file.
+        distance_model (Optional[GraphDistanceModel]): Graph distances between all task
+            locations if a graph file was given, else None (straight-line distances).
     """
 
     DATASETS_PATH = os.path.join(os.getcwd(), "datasets")
     BATCHES_FOLDER = "batches"
     AMRS_FOLDER = "amrs"
+    GRAPHS_FOLDER = "graphs"
+    GRAPHS_CACHE_PATH = os.path.join(os.getcwd(), ".cache", "graphs")
 
-    def __init__(self, batch_file: str, amr_file: str):
+    def __init__(self, batch_file: str, amr_file: str, graph_file: str = None):
         """
         Initializes the DataInput object with the batch and AMR file paths.
 
         Args:
             batch_file (str): The filename of the batch file.
             amr_file (str): The filename of the AMR file.
+            graph_file (str): The filename of an optional warehouse graph file.
         """
-        self.batch_file_path = os.path.join(
-            DataInput.DATASETS_PATH, DataInput.BATCHES_FOLDER, batch_file)
-        self.amr_file_path = os.path.join(
-            DataInput.DATASETS_PATH, DataInput.AMRS_FOLDER, amr_file)
+        self.batch_file_path = DataInput.get_batch_file_path(batch_file)
+        self.amr_file_path = DataInput.get_amr_file_path(amr_file)
+        self.graph_file_path = DataInput.get_graph_file_path(
+            graph_file) if graph_file is not None else None
 
         self.amrs = None
         self.batches = None
+        self.distance_model = None
+
+        self._amrs_by_id = {}
+        self._tasks_by_id = {}
 
         self.read_AMRs()
         self.read_batches()
 
+        if self.graph_file_path is not None:
+            self.read_graph()
+
+    @staticmethod
+    def get_batch_file_path(batch_file: str) -> str:
+        """
+        Returns the path of a batch file inside the datasets folder.
+
+        Args:
+            batch_file (str): The filename of the batch file.
+
+        Returns:
+            str: The path to the batch file.
+        """
+        return os.path.join(DataInput.DATASETS_PATH, DataInput.BATCHES_FOLDER, batch_file)
+
+    @staticmethod
+    def get_amr_file_path(amr_file: str) -> str:
+        """
+        Returns the path of an AMR file inside the datasets folder.
+
+        Args:
+            amr_file (str): The filename of the AMR file.
+
+        Returns:
+            str: The path to the AMR file.
+        """
+        return os.path.join(DataInput.DATASETS_PATH, DataInput.AMRS_FOLDER, amr_file)
+
+    @staticmethod
+    def get_graph_file_path(graph_file: str) -> str:
+        """
+        Returns the path of a warehouse graph file inside the datasets folder.
+
+        Args:
+            graph_file (str): The filename of the graph file.
+
+        Returns:
+            str: The path to the graph file.
+        """
+        return os.path.join(DataInput.DATASETS_PATH, DataInput.GRAPHS_FOLDER, graph_file)
+
     def read_AMRs(self):
         """
         Reads AMRs data from the file and populates the amrs list.
         """
         self.amrs = []
+        self._amrs_by_id = {}
 
         id = 0
         with open(self.amr_file_path, 'r') as json_file:
@@ -63,6 +118,7 @@ class DataInput:
                     amr = AMR(id, friendly_name, kinematics)
 
                     self.amrs.append(amr)
+                    self._amrs_by_id[amr.id] = amr
                     id += 1
 
     def read_batches(self):
@@ -70,6 +126,7 @@ class DataInput:
         Reads Batches data from the file and populates the batches list.
         """
         self.batches = []
+        self._tasks_by_id = {}
 
         with open(self.batch_file_path, 'r') as json_file:
             data = json.load(json_file)
@@ -82,20 +139,74 @@ class DataInput:
                                     task['end_location'][1])
                     time_window = TimeWindow(
                         task['earliest_start'], task['latest_finish'])
-                    tasks.append(
-                        Task(task['id'], start_location, end_location, time_window))
+                    task = Task(task['id'], start_location,
+                                end_location, time_window)
+                    tasks.append(task)
+                    self._tasks_by_id[task.id] = task
 
                 self.batches.append(Batch(batch['id'], tasks))
 
-    def get_task_by_id(self, task_id: int) -> Optional[Task]:
-        for batch in self.batches:
-            for task in batch.tasks:
-                if task.id == task_id:
-                    return task
-        return None
+    def with_amr_file(self, amr_file: str):
+        """
+        Returns a DataInput with another fleet that shares the parsed batches of this one.
+
+        Args:
+            amr_file (str): The filename of the AMR file.
+
+        Returns:
+            DataInput: The data input for the other fleet.
+        """
+        data_input = copy.copy(self)
+        data_input.amr_file_path = DataInput.get_amr_file_path(amr_file)
+        data_input.read_AMRs()
+
+        for amr in data_input.amrs:
+            amr.kinematics.distance_model = self.distance_model
+
+        return data_input
+
+    def with_amrs(self, amrs: List[AMR], amr_file_path: str = None):
+        """
+        Returns a DataInput with an already parsed fleet that shares the parsed batches of this one.
+
+        Args:
+            amrs (List[AMR]): The AMRs of the other fleet.
+            amr_file_path (str): The path to the AMR file the fleet was read from.
+
+        Returns:
+            DataInput: The data input for the other fleet.
+        """
+        data_input = copy.copy(self)
+        data_input.amr_file_path = amr_file_path
+        data_input.amrs = amrs
+        data_input._amrs_by_id = {amr.id: amr for amr in amrs}
+
+        for amr in amrs:
+            amr.kinematics.distance_model = self.distance_model
+
+        return data_input
+
+    def read_graph(self):
+        """
+        Reads the warehouse graph, precomputes the distances between all task locations
+        and lets the kinematics of every AMR use them.
+        """
+        # imported here, so that runs without a graph never load the routing code
+        from framework.warehouse_graph import GraphDistanceModel, WarehouseGraph
+
+        locations = [SchedulingOutput.START_LOCATION]
+        for task in self._tasks_by_id.values():
+            locations.append(task.start_location)
+            locations.append(task.end_location)
+
+        graph = WarehouseGraph(self.graph_file_path)
+        self.distance_model = GraphDistanceModel(graph, locations, cache_path=DataInput.GRAPHS_CACHE_PATH)
 
-    def get_amr_by_id(self, amr_id: int) -> Optional[Task]:
         for amr in self.amrs:
-            if amr.id == amr_id:
-                return amr
-        return None
+            amr.kinematics.distance_model = self.distance_model
+
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        return self._tasks_by_id.get(task_id)
+
+    def get_amr_by_id(self, amr_id: int) -> Optional[AMR]:
+        return self._amrs_by_id.get(amr_id)
@@ -1,4 +1,5 @@
 from framework.data_input import DataInput
+from framework.lower_bounds import Bounds
 from framework.scheduling_output import SchedulingOutput
 
 
@@ -20,6 +21,7 @@ class Evaluation:
         self.total_time = None
         self.lateness = None
         self.execution_time = None
+        self.lower_bounds = None
 
     def set_execution_time(self, execution_time: float):
         """
@@ -30,6 +32,73 @@ class Evaluation:
         """
         self.execution_time = execution_time
 
+    def set_lower_bounds(self, lower_bounds: Bounds):
+        """
+        Set the lower bounds the results are compared against.
+
+        Args:
+            lower_bounds (Bounds): The lower bounds of the evaluated data input.
+        """
+        self.lower_bounds = lower_bounds
+
+    def gaps(self) -> dict:
+        """
+        Returns the relative gaps between the results and their lower bounds.
+
+        Returns:
+            dict: The gap of each bounded metric, or an empty dict if no bounds are set.
+        """
+        if self.lower_bounds is None:
+            return {}
+
+        return {
+            'total_makespan': Bounds.gap(self.total_makespan, self.lower_bounds.total_makespan),
+            'total_distance': Bounds.gap(self.total_distance, self.lower_bounds.total_distance),
+            'lateness': Bounds.gap(self.lateness, self.lower_bounds.lateness)
+        }
+
+    def to_dict(self) -> dict:
+        """
+        Returns the evaluation metrics as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The evaluation metrics.
+        """
+        return {
+            'total_makespan': self.total_makespan,
+            'total_distance': self.total_distance,
+            'total_time': self.total_time,
+            'lateness': self.lateness,
+            'execution_time': self.execution_time,
+            'lower_bounds': self.lower_bounds.to_dict() if self.lower_bounds is not None else None
+        }
+
+    @classmethod
+    def create_from_dict(cls, dictionary: dict, data_input: DataInput = None):
+        """
+        Creates an Evaluation object from metrics previously returned by to_dict.
+
+        Args:
+            dictionary (dict): The evaluation metrics.
+            data_input (DataInput): The data input the metrics refer to, if loaded.
+
+        Returns:
+            Evaluation: The restored evaluation.
+        """
+        evaluation = cls(data_input)
+        evaluation.total_makespan = dictionary['total_makespan']
+        evaluation.total_distance = dictionary['total_distance']
+        evaluation.total_time = dictionary['total_time']
+        evaluation.lateness = dictionary['lateness']
+        evaluation.execution_time = dictionary['execution_time']
+
+        if dictionary.get('lower_bounds') is not None:
+            bounds = dictionary['lower_bounds']
+            evaluation.lower_bounds = Bounds(
+                bounds['total_makespan'], bounds['total_distance'], bounds['lateness'])
+
+        return evaluation
+
     def __str__(self):
         """
         Returns a string representation of the Evaluation object.
@@ -43,6 +112,12 @@ class Evaluation:
         evaluation_str += f"    Total Execution Time: {self.total_time:.2f} seconds\n"
         evaluation_str += f"    Lateness: {self.lateness}\n"
         evaluation_str += f"    Execution Time: {self.execution_time:.5f} seconds\n"
+
+        if self.lower_bounds is not None:
+            gaps = self.gaps()
+            evaluation_str += f"    Makespan Lower Bound: {self.lower_bounds.total_makespan:.2f} seconds (gap {gaps['total_makespan']:.2%})\n"
+            evaluation_str += f"    Empty Travel Distance Lower Bound: {self.lower_bounds.total_distance:.2f} meters (gap {gaps['total_distance']:.2%})\n"
+            evaluation_str += f"    Lateness Lower Bound: {self.lower_bounds.lateness:.2f} (gap {gaps['lateness']:.2%})\n"
         return evaluation_str
 
     def evaluate(self, scheduling_output: SchedulingOutput):
@@ -68,3 +143,39 @@ class Evaluation:
             self.lateness += sum(map(
                 lambda ass: ass.lateness,
                 assignments))
+
+    def evaluate_stored(self, path: str) -> SchedulingOutput:
+        """
+        Evaluates a schedule stored by ScheduleIO against the data input.
+
+        Only the AMR, task and start time of each assignment are taken from the
+        file. Durations, distances and lateness are recomputed from the data
+        input, so a stored schedule is scored exactly like a fresh one.
+
+        Args:
+            path (str): The path of the schedule file (.jsonl or binary).
+
+        Returns:
+            SchedulingOutput: The schedule rebuilt from the file.
+
+        Raises:
+            ScheduleFormatException: If the file is invalid or refers to an AMR or
+                task the data input does not contain.
+        """
+        # imported here, so that workers which only evaluate never load the file formats
+        from framework.schedule_io import ScheduleFormatException, ScheduleIO
+
+        scheduling_output = SchedulingOutput(self.data_input)
+
+        for amr_id, task_id, start_time, *_ in ScheduleIO.iter_file(path):
+            if self.data_input.get_amr_by_id(amr_id) is None:
+                raise ScheduleFormatException(
+                    f"{path} refers to AMR {amr_id}, which is not part of the data input.")
+            if self.data_input.get_task_by_id(task_id) is None:
+                raise ScheduleFormatException(
+                    f"{path} refers to task {task_id}, which is not part of the data input.")
+
+            scheduling_output.add_assignment(amr_id, task_id, start_time)
+
+        self.evaluate(scheduling_output)
+        return scheduling_output
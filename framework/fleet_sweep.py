@@ -0,0 +1,201 @@
+import os
+import time
+
+from typing import List, Sequence
+
+from framework.cost_cache import CostCache
+from framework.data_input import DataInput
+from framework.evaluation import Evaluation
+from framework.scheduling_output import SchedulingOutput
+
+
+_worker_data_input = None
+_worker_cost_cache = None
+
+
+def _init_worker(data_input: DataInput, cost_cache: CostCache):
+    global _worker_data_input, _worker_cost_cache
+    _worker_data_input = data_input
+    _worker_cost_cache = cost_cache
+
+
+def _run_fleet(job) -> dict:
+    amr_file, amrs, OptimizerImpl, optimizer_params = job
+
+    data_input = _worker_data_input.with_amrs(amrs, DataInput.get_amr_file_path(amr_file))
+
+    start_time = time.time()
+
+    optimizer = OptimizerImpl(**optimizer_params)
+    scheduling_output = optimizer.run(data_input, _worker_cost_cache)
+
+    end_time = time.time()
+
+    evaluation = Evaluation(data_input)
+    evaluation.set_execution_time(end_time - start_time)
+    evaluation.evaluate(scheduling_output)
+    evaluation.set_lower_bounds(optimizer.lower_bounds.total())
+
+    return {
+        'amr_file': amr_file,
+        'fleet_size': len(data_input.amrs),
+        'evaluation': evaluation.to_dict()
+    }
+
+
+class FleetSweepResult:
+    """
+    The evaluation of one fleet configuration within a fleet sweep.
+
+    Attributes:
+        amr_file (str): The filename of the AMR file.
+        fleet_size (int): The number of AMRs in the fleet.
+        evaluation (Evaluation): The evaluation of the run.
+        marginal_makespan_gain (Optional[float]): Makespan saved per AMR added
+            compared to the next smaller fleet, None for the smallest fleet.
+        marginal_lateness_gain (Optional[float]): Lateness saved per AMR added
+            compared to the next smaller fleet, None for the smallest fleet.
+    """
+
+    def __init__(self, amr_file: str, fleet_size: int, evaluation: Evaluation):
+        """
+        Initializes a FleetSweepResult object.
+
+        Args:
+            amr_file (str): The filename of the AMR file.
+            fleet_size (int): The number of AMRs in the fleet.
+            evaluation (Evaluation): The evaluation of the run.
+        """
+        self.amr_file = amr_file
+        self.fleet_size = fleet_size
+        self.evaluation = evaluation
+        self.marginal_makespan_gain = None
+        self.marginal_lateness_gain = None
+
+
+class FleetSweep:
+    """
+    Runs one batch file against several fleet configurations.
+
+    The tasks and fleets are parsed once in the calling process. The
+    distances of every loaded leg and every possible empty leg are computed
+    once, kept in a compact matrix and handed to the optimizers through a
+    shared CostCache, which derives the travel times of each motion profile
+    from them. The fleets are then run concurrently in worker processes,
+    each of which receives the parsed tasks and the cache once and the
+    parsed fleet with every job, so workers never read files.
+
+    Attributes:
+        batch_file (str): The filename of the batch file.
+        amr_files (List[str]): The filenames of the AMR files to compare.
+        OptimizerImpl: The optimizer class. It must be importable by worker processes.
+        optimizer_params (dict): The keyword arguments the optimizer is created with.
+        graph_file (str): The filename of an optional warehouse graph file.
+        results (List[FleetSweepResult]): The results ordered by fleet size.
+    """
+
+    def __init__(self, batch_file: str, amr_files: Sequence[str], OptimizerImpl, optimizer_params: dict = None,
+                 graph_file: str = None):
+        """
+        Initializes the FleetSweep object.
+
+        Args:
+            batch_file (str): The filename of the batch file.
+            amr_files (Sequence[str]): The filenames of the AMR files to compare.
+            OptimizerImpl: The optimizer class.
+            optimizer_params (dict): The keyword arguments the optimizer is created with.
+            graph_file (str): The filename of an optional warehouse graph file.
+        """
+        self.batch_file = batch_file
+        self.amr_files = list(amr_files)
+        self.OptimizerImpl = OptimizerImpl
+        self.optimizer_params = optimizer_params or {}
+        self.graph_file = graph_file
+        self.results: List[FleetSweepResult] = None
+
+    def run(self, processes: int = None) -> List[FleetSweepResult]:
+        """
+        Runs all fleet configurations and computes the marginal gains.
+
+        Args:
+            processes (int): The number of worker processes (default: number of CPUs).
+                With a single process, all fleets run in the calling process.
+
+        Returns:
+            List[FleetSweepResult]: The results ordered by fleet size.
+        """
+        data_input = DataInput(self.batch_file, self.amr_files[0], self.graph_file)
+        cost_cache = self.build_cost_cache(data_input)
+
+        jobs = [(amr_file, data_input.with_amr_file(amr_file).amrs, self.OptimizerImpl, self.optimizer_params)
+                for amr_file in self.amr_files]
+
+        processes = processes if processes is not None else os.cpu_count() or 1
+        processes = min(processes, len(jobs))
+
+        if processes > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(processes, initializer=_init_worker,
+                                     initargs=(data_input, cost_cache)) as executor:
+                outputs = list(executor.map(_run_fleet, jobs))
+        else:
+            _init_worker(data_input, cost_cache)
+            outputs = list(map(_run_fleet, jobs))
+
+        self.results = sorted(
+            (FleetSweepResult(output['amr_file'], output['fleet_size'],
+                              Evaluation.create_from_dict(output['evaluation']))
+             for output in outputs),
+            key=lambda result: result.fleet_size)
+
+        for smaller, larger in zip(self.results, self.results[1:]):
+            added_amrs = larger.fleet_size - smaller.fleet_size
+            if added_amrs <= 0:
+                continue
+
+            larger.marginal_makespan_gain = (
+                smaller.evaluation.total_makespan - larger.evaluation.total_makespan) / added_amrs
+            larger.marginal_lateness_gain = (
+                smaller.evaluation.lateness - larger.evaluation.lateness) / added_amrs
+
+        return self.results
+
+    def build_cost_cache(self, data_input: DataInput) -> CostCache:
+        """
+        Computes the distances of all loaded and empty legs of the batch file.
+
+        Args:
+            data_input (DataInput): The data input holding the parsed tasks.
+
+        Returns:
+            CostCache: The primed cost cache.
+        """
+        tasks = [task for batch in data_input.batches for task in batch.tasks]
+        origins = [SchedulingOutput.START_LOCATION] + [task.end_location for task in tasks]
+        destinations = [task.start_location for task in tasks]
+        loaded_legs = [(task.start_location, task.end_location) for task in tasks]
+
+        cost_cache = CostCache(data_input.distance_model)
+        cost_cache.prime(origins, destinations, loaded_legs)
+
+        return cost_cache
+
+    def __str__(self):
+        """
+        Returns a string representation of the FleetSweep results.
+
+        Returns:
+            str: String representation of the FleetSweep results.
+        """
+        sweep_str = f"Fleet Sweep Results ({self.batch_file}):\n"
+        sweep_str += f"    {'AMR File':<20} {'AMRs':>6} {'Makespan':>12} {'Lateness':>12} {'dMakespan/AMR':>14} {'dLateness/AMR':>14}\n"
+
+        for result in self.results:
+            makespan_gain = '-' if result.marginal_makespan_gain is None else f"{result.marginal_makespan_gain:.2f}"
+            lateness_gain = '-' if result.marginal_lateness_gain is None else f"{result.marginal_lateness_gain:.2f}"
+            sweep_str += (f"    {result.amr_file:<20} {result.fleet_size:>6} "
+                          f"{result.evaluation.total_makespan:>12.2f} {result.evaluation.lateness:>12.2f} "
+                          f"{makespan_gain:>14} {lateness_gain:>14}\n")
+
+        return sweep_str
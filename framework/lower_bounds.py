@@ -0,0 +1,286 @@
+import math
+
+from itertools import repeat
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from model.batch import Batch
+from model.kinematics import Kinematics
+
+from framework.data_input import DataInput
+from framework.scheduling_output import SchedulingOutput
+
+
+class Bounds:
+    """
+    Lower bounds on the metrics reported by Evaluation.
+
+    Attributes:
+        total_makespan (float): Lower bound on the makespan in seconds.
+        total_distance (float): Lower bound on the empty travel distance in meters.
+        lateness (float): Lower bound on the summed lateness in seconds.
+    """
+
+    def __init__(self, total_makespan: float, total_distance: float, lateness: float):
+        """
+        Initializes a Bounds object with the given values.
+
+        Args:
+            total_makespan (float): Lower bound on the makespan in seconds.
+            total_distance (float): Lower bound on the empty travel distance in meters.
+            lateness (float): Lower bound on the summed lateness in seconds.
+        """
+        self.total_makespan = total_makespan
+        self.total_distance = total_distance
+        self.lateness = lateness
+
+    def to_dict(self) -> dict:
+        """
+        Returns the bounds as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The bounds keyed like the Evaluation metrics.
+        """
+        return {
+            'total_makespan': self.total_makespan,
+            'total_distance': self.total_distance,
+            'lateness': self.lateness
+        }
+
+    @staticmethod
+    def gap(value: float, bound: float) -> float:
+        """
+        Returns the relative gap between an achieved value and its lower bound.
+
+        Args:
+            value (float): The achieved value.
+            bound (float): The lower bound of the value.
+
+        Returns:
+            float: (value - bound) / value, or 0 if the value is 0.
+        """
+        if value <= 0:
+            return 0.0
+        return max(0.0, (value - bound) / value)
+
+    def __str__(self):
+        """
+        Returns a string representation of the Bounds object.
+
+        Returns:
+            str: String representation of the Bounds object.
+        """
+        bounds_str = "Lower Bounds:\n"
+        bounds_str += f"    Total Makespan: {self.total_makespan:.2f} seconds\n"
+        bounds_str += f"    Total Empty Travel Distance: {self.total_distance:.2f} meters\n"
+        bounds_str += f"    Lateness: {self.lateness:.2f}\n"
+        return bounds_str
+
+
+class _OriginGrid:
+    """
+    Uniform grid over a fixed set of points for nearest-point queries.
+
+    The cell size is chosen so that a cell holds about two points on average.
+    A query searches rings of cells around the queried location until no
+    unvisited cell can hold a closer point.
+    """
+
+    POINTS_PER_CELL = 2
+
+    def __init__(self, points: Sequence[Tuple[float, float]]):
+        self.points = points
+
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        self.min_x, self.min_y = min(xs), min(ys)
+        width = max(xs) - self.min_x
+        height = max(ys) - self.min_y
+
+        area = max(width * height, 1e-12)
+        self.cell_size = max(math.sqrt(area * _OriginGrid.POINTS_PER_CELL / len(points)),
+                             max(width, height) / len(points), 1e-9)
+        self.columns = int(width / self.cell_size) + 1
+        self.rows = int(height / self.cell_size) + 1
+
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for index, point in enumerate(points):
+            self.cells.setdefault(self._cell(point), []).append(index)
+
+    def _cell(self, point: Tuple[float, float]) -> Tuple[int, int]:
+        column = int((point[0] - self.min_x) // self.cell_size)
+        row = int((point[1] - self.min_y) // self.cell_size)
+        return (min(max(column, 0), self.columns - 1), min(max(row, 0), self.rows - 1))
+
+    def nearest_distance(self, location: Tuple[float, float], skip: Optional[int] = None) -> float:
+        """
+        Returns the distance from a location to the closest point other than the one at index skip.
+        """
+        column, row = self._cell(location)
+        # points outside the grid's cells are at least this far from every cell
+        outside = max(self.min_x - location[0], location[0] - (self.min_x + self.columns * self.cell_size),
+                      self.min_y - location[1], location[1] - (self.min_y + self.rows * self.cell_size), 0.0)
+
+        shortest = math.inf
+        max_ring = max(column, self.columns - 1 - column, row, self.rows - 1 - row)
+
+        for ring in range(max_ring + 1):
+            if shortest <= max(outside, (ring - 1) * self.cell_size):
+                break
+
+            for cell in self._ring_cells(column, row, ring):
+                for index in self.cells.get(cell, ()):
+                    if index != skip:
+                        shortest = min(shortest, math.dist(self.points[index], location))
+
+        return shortest
+
+    def _ring_cells(self, column: int, row: int, ring: int) -> Iterator[Tuple[int, int]]:
+        # the cells at Chebyshev distance ring from (column, row) that lie within the grid
+        if ring == 0:
+            yield column, row
+            return
+
+        for cell_row in (row - ring, row + ring):
+            if 0 <= cell_row < self.rows:
+                for cell_column in range(max(column - ring, 0), min(column + ring, self.columns - 1) + 1):
+                    yield cell_column, cell_row
+
+        for cell_column in (column - ring, column + ring):
+            if 0 <= cell_column < self.columns:
+                for cell_row in range(max(row - ring + 1, 0), min(row + ring - 1, self.rows - 1) + 1):
+                    yield cell_column, cell_row
+
+
+class LowerBounds:
+    """
+    Computes cheap lower bounds per batch from the tasks and the fleet's kinematics.
+
+    Every bound relaxes the problem per task, taking for each leg the fastest
+    motion profile in the fleet:
+
+    - every task needs its loaded leg and an empty leg to its start, coming
+      from the start location or from the end of another task. The summed
+      work divided by the fleet size, as well as the longest single task,
+      bound the makespan.
+    - the shortest possible empty leg of every task bounds the empty travel
+      distance.
+    - a task cannot finish before its shortest empty and loaded legs have
+      been travelled, which forces lateness on tasks with tight windows.
+
+    The bounds hold for every schedule in which the assignments of an AMR do
+    not overlap. They are computed once per batch and cached. Over several
+    batches the distance and lateness bounds add up, the makespan bound is
+    recomputed from the summed work.
+
+    Attributes:
+        data_input (DataInput): The data input the bounds are computed for.
+        fleet_size (int): The number of AMRs.
+    """
+
+    def __init__(self, data_input: DataInput):
+        """
+        Initializes the LowerBounds object for the given DataInput.
+
+        Args:
+            data_input (DataInput): The data input to compute bounds for.
+        """
+        self.data_input = data_input
+        self.fleet_size = len(data_input.amrs)
+
+        profiles = {}
+        for amr in data_input.amrs:
+            profiles.setdefault(amr.kinematics.motion_profile, amr.kinematics)
+        self._kinematics: List[Kinematics] = list(profiles.values())
+
+        # every location an empty leg can start from, and the position of the task ending there
+        self._origins: List[Tuple[float, float]] = [SchedulingOutput.START_LOCATION]
+        self._origin_position: Dict[int, int] = {}
+        for batch in data_input.batches:
+            for task in batch.tasks:
+                self._origin_position[task.id] = len(self._origins)
+                self._origins.append(task.end_location)
+        self._origin_grid = _OriginGrid(self._origins)
+
+        # per batch id: (summed work, longest task, empty distance, lateness)
+        self._batch_terms: Dict[int, Tuple[float, float, float, float]] = {}
+
+    def for_batch(self, batch: Batch) -> Bounds:
+        """
+        Returns the lower bounds for the tasks of a single batch.
+
+        Args:
+            batch (Batch): The batch to bound.
+
+        Returns:
+            Bounds: The lower bounds of the batch.
+        """
+        work, longest_task, distance, lateness = self._terms(batch)
+        return Bounds(self._makespan(work, longest_task), distance, lateness)
+
+    def total(self) -> Bounds:
+        """
+        Returns the lower bounds for all batches of the data input.
+
+        Returns:
+            Bounds: The lower bounds of the whole data input.
+        """
+        work = longest_task = distance = lateness = 0.0
+
+        for batch in self.data_input.batches:
+            batch_work, batch_longest_task, batch_distance, batch_lateness = self._terms(batch)
+            work += batch_work
+            longest_task = max(longest_task, batch_longest_task)
+            distance += batch_distance
+            lateness += batch_lateness
+
+        return Bounds(self._makespan(work, longest_task), distance, lateness)
+
+    def _makespan(self, work: float, longest_task: float) -> float:
+        if self.fleet_size == 0:
+            return 0.0
+        return max(work / self.fleet_size, longest_task)
+
+    def _terms(self, batch: Batch) -> Tuple[float, float, float, float]:
+        terms = self._batch_terms.get(batch.id)
+        if terms is not None:
+            return terms
+
+        work = longest_task = distance = lateness = 0.0
+
+        for task in batch.tasks:
+            empty_distance, empty_time = self._shortest_empty_leg(task.id, task.start_location)
+
+            loaded_time = min(kinematics.calc_time(task.start_location, task.end_location)
+                              for kinematics in self._kinematics)
+
+            task_time = empty_time + loaded_time
+            work += task_time
+            longest_task = max(longest_task, task_time)
+            distance += empty_distance
+            lateness += max(0.0, task_time - task.time_window.latest_finish)
+
+        terms = self._batch_terms[batch.id] = (work, longest_task, distance, lateness)
+        return terms
+
+    def _shortest_empty_leg(self, task_id: int, start_location: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Returns the shortest distance and time of any empty leg ending at the task's start.
+        """
+        position = self._origin_position.get(task_id)
+        shortest_distance = self._origin_grid.nearest_distance(start_location, position)
+
+        distances = None
+        shortest_time = math.inf
+        for kinematics in self._kinematics:
+            if kinematics.acceleration == abs(kinematics.deceleration):
+                # the travel time is monotonic in the distance for symmetric profiles
+                time = kinematics.calc_time_for_distance(shortest_distance)
+            else:
+                if distances is None:
+                    distances = list(map(math.dist, self._origins, repeat(start_location)))
+                    if position is not None:
+                        del distances[position]
+                time = min(map(kinematics.calc_time_for_distance, distances))
+            shortest_time = min(shortest_time, time)
+
+        return shortest_distance, shortest_time
@@ -0,0 +1,219 @@
+import os
+import sys
+import json
+import hashlib
+import tempfile
+
+from typing import Optional
+
+
+class ResultCache:
+    """
+    On-disk cache for the results of optimization runs.
+
+    Entries are keyed by the content of the batch file, the AMR file and the
+    optional graph file, the source code of the optimizer, its base classes and
+    every repository module they import, the source code of the framework,
+    model and optimization packages, and the optimizer parameters, so a run is
+    only repeated if one of them changed. Each entry stores the evaluation
+    metrics and the serialized schedule as a JSON file. When the cache grows
+    beyond its size limit, the least recently used entries are removed.
+
+    Attributes:
+        cache_path (str): The folder the entries are stored in.
+        max_bytes (int): The maximum total size of all entries.
+    """
+
+    CACHE_PATH = os.path.join(os.getcwd(), ".cache", "results")
+    MAX_BYTES = 256 * 1024 * 1024
+
+    # bump when the layout of the stored entries changes
+    SCHEMA_VERSION = 1
+
+    # the repository folder the source packages live in
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # packages whose code determines the metrics of every run
+    SOURCE_PACKAGES = ['framework', 'model', 'optimization']
+
+    _source_digest = None
+
+    def __init__(self, cache_path: str = None, max_bytes: int = None):
+        """
+        Initializes the ResultCache object and creates its folder.
+
+        Args:
+            cache_path (str): The folder to store the entries in (default: CACHE_PATH).
+            max_bytes (int): The maximum total size of all entries (default: MAX_BYTES).
+        """
+        self.cache_path = cache_path if cache_path is not None else ResultCache.CACHE_PATH
+        self.max_bytes = max_bytes if max_bytes is not None else ResultCache.MAX_BYTES
+
+        os.makedirs(self.cache_path, exist_ok=True)
+
+    def key(self, batch_file_path: str, amr_file_path: str, OptimizerImpl, optimizer_params: dict = None,
+            graph_file_path: str = None) -> str:
+        """
+        Computes the cache key of a run.
+
+        Args:
+            batch_file_path (str): The path to the batch file.
+            amr_file_path (str): The path to the AMR file.
+            OptimizerImpl: The optimizer class.
+            optimizer_params (dict): The keyword arguments the optimizer is created with.
+            graph_file_path (str): The path to the warehouse graph file, if one is used.
+
+        Returns:
+            str: The hex digest identifying the run.
+        """
+        digest = hashlib.sha256()
+
+        for path in (batch_file_path, amr_file_path, graph_file_path):
+            if path is None:
+                digest.update(b'\0')
+                continue
+            with open(path, 'rb') as file:
+                digest.update(hashlib.sha256(file.read()).digest())
+
+        digest.update(str(ResultCache.SCHEMA_VERSION).encode())
+        digest.update(ResultCache._package_digest())
+
+        # whole modules are hashed, so changes to helpers next to the classes count too
+        digest.update(OptimizerImpl.__qualname__.encode())
+        for module in ResultCache._optimizer_modules(OptimizerImpl):
+            digest.update(module.__name__.encode())
+            with open(module.__file__, 'rb') as file:
+                digest.update(hashlib.sha256(file.read()).digest())
+
+        digest.update(json.dumps(optimizer_params or {},
+                      sort_keys=True, default=repr).encode())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _optimizer_modules(OptimizerImpl) -> list:
+        """
+        Returns the modules defining the optimizer and its base classes and, transitively,
+        all modules they import from the repository or the optimizer's own folder.
+        """
+        optimizer_module = sys.modules.get(OptimizerImpl.__module__)
+        folders = [ResultCache.ROOT]
+        if getattr(optimizer_module, '__file__', None):
+            folders.append(os.path.dirname(os.path.abspath(optimizer_module.__file__)))
+
+        def is_source(module) -> bool:
+            path = getattr(module, '__file__', None)
+            return path is not None and path.endswith('.py') and any(
+                os.path.abspath(path).startswith(folder + os.sep) for folder in folders)
+
+        pending = [sys.modules.get(cls.__module__) for cls in OptimizerImpl.__mro__]
+        modules = {}
+
+        while pending:
+            module = pending.pop()
+            if module is None or module.__name__ in modules or not is_source(module):
+                continue
+            modules[module.__name__] = module
+
+            for value in vars(module).values():
+                if isinstance(value, type(sys)):
+                    pending.append(value)
+                else:
+                    pending.append(sys.modules.get(getattr(value, '__module__', None) or ''))
+
+        return [modules[name] for name in sorted(modules)]
+
+    @staticmethod
+    def _package_digest() -> bytes:
+        """
+        Returns the digest of all sources in SOURCE_PACKAGES, computed once per process.
+        """
+        if ResultCache._source_digest is None:
+            digest = hashlib.sha256()
+
+            for package in ResultCache.SOURCE_PACKAGES:
+                folder = os.path.join(ResultCache.ROOT, package)
+                for filename in sorted(os.listdir(folder)):
+                    if not filename.endswith('.py'):
+                        continue
+                    digest.update(os.path.join(package, filename).encode())
+                    with open(os.path.join(folder, filename), 'rb') as file:
+                        digest.update(hashlib.sha256(file.read()).digest())
+
+            ResultCache._source_digest = digest.digest()
+
+        return ResultCache._source_digest
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns the entry stored under the given key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[dict]: The entry with the keys 'evaluation' and 'schedule',
+                or None if there is no such entry.
+        """
+        path = self._entry_path(key)
+
+        try:
+            with open(path, 'r') as json_file:
+                entry = json.load(json_file)
+        except (OSError, ValueError):
+            return None
+
+        # mark the entry as recently used
+        os.utime(path)
+        return entry
+
+    def put(self, key: str, evaluation_dict: dict, schedule_dict: dict):
+        """
+        Stores an entry and evicts old entries if the cache became too large.
+
+        Args:
+            key (str): The cache key.
+            evaluation_dict (dict): The evaluation metrics, see Evaluation.to_dict.
+            schedule_dict (dict): The serialized schedule, see SchedulingOutput.to_dict.
+        """
+        path = self._entry_path(key)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_path, suffix='.tmp')
+
+        with os.fdopen(file_descriptor, 'w') as json_file:
+            json.dump({'evaluation': evaluation_dict,
+                      'schedule': schedule_dict}, json_file)
+
+        # entries appear atomically, so concurrent runs never read partial files
+        os.replace(temporary_path, path)
+
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits into max_bytes.
+        """
+        entries = []
+        total_bytes = 0
+
+        for filename in os.listdir(self.cache_path):
+            if not filename.endswith('.json'):
+                continue
+
+            stat = os.stat(os.path.join(self.cache_path, filename))
+            entries.append((stat.st_mtime, stat.st_size, filename))
+            total_bytes += stat.st_size
+
+        entries.sort()
+
+        for _, size, filename in entries:
+            if total_bytes <= self.max_bytes:
+                break
+
+            try:
+                os.remove(os.path.join(self.cache_path, filename))
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_path, key + '.json')
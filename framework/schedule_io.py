@@ -0,0 +1,234 @@
+import json
+import struct
+
+from typing import Iterator, Tuple
+
+from framework.scheduling_output import Assignment, SchedulingOutput
+
+
+Record = Tuple[int, int, float, float, float, float]
+
+
+class ScheduleFormatException(Exception):
+    pass
+
+
+class ScheduleIO:
+    """
+    Reads and writes scheduling outputs in a compact binary format and as JSON lines.
+
+    The binary format starts with a header of the magic bytes, the format
+    version and the number of assignments. It is followed by one fixed-size
+    little-endian record per assignment: amr_id, task_id (int32) and
+    start_time, duration, empty_travel_distance, lateness (float64).
+    Assignments are written per AMR in route order, so reading them back
+    restores every route.
+    """
+
+    MAGIC = b'OPTS'
+    VERSION = 1
+
+    HEADER = struct.Struct('<4sHQ')
+    RECORD = struct.Struct('<iidddd')
+
+    # number of records packed or unpacked at once, which bounds the memory used
+    CHUNK_RECORDS = 65536
+
+    JSONL_FIELDS = ('amr_id', 'task_id', 'start_time', 'duration',
+                    'empty_travel_distance', 'lateness')
+
+    @staticmethod
+    def write_binary(scheduling_output: SchedulingOutput, path: str):
+        """
+        Writes a scheduling output to a binary file.
+
+        Args:
+            scheduling_output (SchedulingOutput): The schedule to store.
+            path (str): The path of the file to write.
+        """
+        count = sum(map(len, scheduling_output.assignments.values()))
+        pack = ScheduleIO.RECORD.pack
+
+        with open(path, 'wb') as file:
+            file.write(ScheduleIO.HEADER.pack(
+                ScheduleIO.MAGIC, ScheduleIO.VERSION, count))
+
+            chunk = []
+            for assignments in scheduling_output.assignments.values():
+                for ass in assignments:
+                    chunk.append(pack(ass.amr_id, ass.task_id, ass.start_time, ass.duration,
+                                      ass.empty_travel_distance, ass.lateness))
+
+                    if len(chunk) >= ScheduleIO.CHUNK_RECORDS:
+                        file.write(b''.join(chunk))
+                        chunk = []
+
+            file.write(b''.join(chunk))
+
+    @staticmethod
+    def iter_binary(path: str) -> Iterator[Record]:
+        """
+        Iterates over the records of a binary schedule file.
+
+        Args:
+            path (str): The path of the file to read.
+
+        Yields:
+            Tuple[int, int, float, float, float, float]: The amr_id, task_id, start_time,
+                duration, empty_travel_distance and lateness of each assignment.
+
+        Raises:
+            ScheduleFormatException: If the file is not a schedule file of a known version.
+        """
+        with open(path, 'rb') as file:
+            header = file.read(ScheduleIO.HEADER.size)
+            if len(header) < ScheduleIO.HEADER.size:
+                raise ScheduleFormatException(f"{path} is too short to be a schedule file.")
+
+            magic, version, count = ScheduleIO.HEADER.unpack(header)
+            if magic != ScheduleIO.MAGIC:
+                raise ScheduleFormatException(f"{path} is not a schedule file.")
+            if version != ScheduleIO.VERSION:
+                raise ScheduleFormatException(
+                    f"{path} has unsupported schedule format version {version}.")
+
+            remaining = count
+            while remaining > 0:
+                records = min(remaining, ScheduleIO.CHUNK_RECORDS)
+                data = file.read(records * ScheduleIO.RECORD.size)
+                if len(data) < records * ScheduleIO.RECORD.size:
+                    raise ScheduleFormatException(f"{path} is truncated.")
+
+                yield from ScheduleIO.RECORD.iter_unpack(data)
+                remaining -= records
+
+    @staticmethod
+    def read_binary(path: str, data_input) -> SchedulingOutput:
+        """
+        Reads a scheduling output from a binary file, keeping the stored metrics.
+
+        Args:
+            path (str): The path of the file to read.
+            data_input (DataInput): The data input the schedule refers to.
+
+        Returns:
+            SchedulingOutput: The restored scheduling output.
+        """
+        return SchedulingOutput.create_from_records(ScheduleIO.iter_binary(path), data_input)
+
+    @staticmethod
+    def write_jsonl(scheduling_output: SchedulingOutput, path: str):
+        """
+        Writes a scheduling output as one JSON object per assignment.
+
+        Args:
+            scheduling_output (SchedulingOutput): The schedule to store.
+            path (str): The path of the file to write.
+        """
+        with ScheduleJSONLWriter(path) as writer:
+            for assignments in scheduling_output.assignments.values():
+                for ass in assignments:
+                    writer.write(ass)
+
+    @staticmethod
+    def iter_jsonl(path: str) -> Iterator[Record]:
+        """
+        Iterates over the records of a JSON lines schedule file.
+
+        Args:
+            path (str): The path of the file to read.
+
+        Yields:
+            Tuple[int, int, float, float, float, float]: The amr_id, task_id, start_time,
+                duration, empty_travel_distance and lateness of each assignment.
+        """
+        fields = ScheduleIO.JSONL_FIELDS
+
+        with open(path, 'r') as file:
+            for line in file:
+                if line.strip():
+                    obj = json.loads(line)
+                    yield tuple(obj[field] for field in fields)
+
+    @staticmethod
+    def read_jsonl(path: str, data_input) -> SchedulingOutput:
+        """
+        Reads a scheduling output from a JSON lines file, keeping the stored metrics.
+
+        Args:
+            path (str): The path of the file to read.
+            data_input (DataInput): The data input the schedule refers to.
+
+        Returns:
+            SchedulingOutput: The restored scheduling output.
+        """
+        return SchedulingOutput.create_from_records(ScheduleIO.iter_jsonl(path), data_input)
+
+    @staticmethod
+    def iter_file(path: str) -> Iterator[Record]:
+        """
+        Iterates over the records of a schedule file, choosing the format by extension.
+
+        Files ending in .jsonl are read as JSON lines, all others as binary.
+
+        Args:
+            path (str): The path of the file to read.
+
+        Yields:
+            Tuple[int, int, float, float, float, float]: The records of the file.
+        """
+        if path.endswith('.jsonl'):
+            return ScheduleIO.iter_jsonl(path)
+        return ScheduleIO.iter_binary(path)
+
+
+class ScheduleJSONLWriter:
+    """
+    Streams assignments to a JSON lines file without keeping them in memory.
+
+    Can be used as a context manager; assignments may be written as soon as
+    they are produced.
+
+    Attributes:
+        path (str): The path of the file being written.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens the file for writing.
+
+        Args:
+            path (str): The path of the file to write.
+        """
+        self.path = path
+        self._file = open(path, 'w')
+        self._dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+    def write(self, assignment: Assignment):
+        """
+        Appends one assignment to the file.
+
+        Args:
+            assignment (Assignment): The assignment to write.
+        """
+        self._file.write(self._dumps({
+            'amr_id': assignment.amr_id,
+            'task_id': assignment.task_id,
+            'start_time': assignment.start_time,
+            'duration': assignment.duration,
+            'empty_travel_distance': assignment.empty_travel_distance,
+            'lateness': assignment.lateness
+        }))
+        self._file.write('\n')
+
+    def close(self):
+        """
+        Flushes and closes the file.
+        """
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,7 +1,7 @@
-from typing import Tuple
+from typing import Iterable, List, Sequence, Tuple
 
 from collections import defaultdict
-from model.kinematics import Kinematics
+from framework.cost_cache import CostCache
 
 
 class Assignment:
@@ -24,18 +24,23 @@ class SchedulingOutput:
     Attributes:
         task_assignments (List[Tuple[int, int, float]]): List of task assignments for each AMR.
             Each tuple contains (task_id, amr_id, assigned_time).
+        cost_cache (CostCache): The cache used for travel times and distances.
     """
 
-    def __init__(self, data_input):
+    START_LOCATION = (0.0, 0.0)
+
+    def __init__(self, data_input, cost_cache: CostCache = None):
         self.data_intput = data_input
         self.assignments = defaultdict(list)
+        self.cost_cache = cost_cache if cost_cache is not None else CostCache(
+            data_input.distance_model)
 
     def add_assignment(self, amr_id: int, task_id: int, start_time=None):
         if start_time is None:
 
             task = self.data_intput.get_task_by_id(task_id)
 
-            if len(self.assignments[amr_id]) == 0:
+            if len(self.assignments.get(amr_id, [])) == 0:
                 start_time = 0
             else:
                 last_assignment = self.assignments[amr_id][-1]
@@ -54,27 +59,101 @@ class SchedulingOutput:
         self.assignments[amr_id].append(
             Assignment(amr_id, task_id, start_time, duration, empty_travel_distance, lateness))
 
+    def to_dict(self) -> dict:
+        """
+        Returns the assignments as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The assignments, each as [amr_id, task_id, start_time, duration,
+                empty_travel_distance, lateness].
+        """
+        return {
+            'assignments': [
+                [ass.amr_id, ass.task_id, ass.start_time, ass.duration,
+                 ass.empty_travel_distance, ass.lateness]
+                for assignments in self.assignments.values()
+                for ass in assignments
+            ]
+        }
+
+    @classmethod
+    def create_from_dict(cls, dictionary: dict, data_input):
+        """
+        Creates a SchedulingOutput object from assignments previously returned by to_dict.
+
+        Args:
+            dictionary (dict): The serialized assignments.
+            data_input (DataInput): The data input the assignments refer to.
+
+        Returns:
+            SchedulingOutput: The restored scheduling output.
+        """
+        return cls.create_from_records(dictionary['assignments'], data_input)
+
+    @classmethod
+    def create_from_records(cls, records: Iterable[Sequence], data_input):
+        """
+        Creates a SchedulingOutput object from assignment records, keeping the stored metrics.
+
+        Args:
+            records (Iterable[Sequence]): The amr_id, task_id, start_time, duration,
+                empty_travel_distance and lateness of each assignment, in route order.
+            data_input (DataInput): The data input the assignments refer to.
+
+        Returns:
+            SchedulingOutput: The restored scheduling output.
+        """
+        scheduling_output = cls(data_input)
+        assignments = scheduling_output.assignments
+
+        for amr_id, task_id, start_time, duration, empty_travel_distance, lateness in records:
+            assignments[amr_id].append(
+                Assignment(amr_id, task_id, start_time, duration, empty_travel_distance, lateness))
+
+        return scheduling_output
+
+    def truncate(self, amr_id: int, length: int) -> List[Assignment]:
+        """
+        Removes all assignments of an AMR after the first `length` ones.
+        An AMR left without assignments is removed from the assignments.
+
+        Args:
+            amr_id (int): The AMR whose route is shortened.
+            length (int): The number of assignments to keep.
+
+        Returns:
+            List[Assignment]: The removed assignments in their previous order.
+        """
+        route = self.assignments.get(amr_id, [])
+        removed = route[length:]
+        del route[length:]
+
+        if len(route) == 0:
+            self.assignments.pop(amr_id, None)
+
+        return removed
+
     def _calc_assignment_metrics(self, amr_id, task_id, start_time) -> Tuple[float, float]:
 
         kinematics = self.data_intput.get_amr_by_id(amr_id).kinematics
         task = self.data_intput.get_task_by_id(task_id)
 
-        if len(self.assignments[amr_id]) == 0:
-            last_location = (0.0, 0.0)
+        if len(self.assignments.get(amr_id, [])) == 0:
+            last_location = SchedulingOutput.START_LOCATION
         else:
             previous_task_id = self.assignments[amr_id][-1].task_id
             previous_task = self.data_intput.get_task_by_id(previous_task_id)
 
             last_location = previous_task.end_location
 
-        empty_travel_duration = kinematics.calc_time(
-            last_location, task.start_location)
+        empty_travel_duration = self.cost_cache.travel_time(
+            kinematics, last_location, task.start_location)
 
-        empty_travel_distance = Kinematics.distance(
+        empty_travel_distance = self.cost_cache.distance(
             last_location, task.start_location)
 
-        execution_duration = kinematics.calc_time(
-            task.start_location, task.end_location)
+        execution_duration = self.cost_cache.travel_time(
+            kinematics, task.start_location, task.end_location)
 
         task_end_time = start_time + empty_travel_duration + execution_duration
         lateness = max(0, task_end_time - task.time_window.latest_finish)
@@ -0,0 +1,317 @@
+import gc
+import heapq
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional
+
+from framework.cost_cache import CostCache
+from framework.data_input import DataInput
+from framework.scheduling_output import SchedulingOutput
+
+
+class AMRState:
+    """
+    The states an AMR can be in while a schedule is replayed.
+    """
+    IDLE = "idle"
+    EMPTY_TRAVEL = "empty_travel"
+    EXECUTION = "execution"
+
+
+class StateSegment(NamedTuple):
+    """
+    A period of time in which an AMR stays in one state.
+
+    Attributes:
+        state (str): One of the AMRState values.
+        start_time (float): The start of the segment in seconds.
+        end_time (float): The end of the segment in seconds.
+        task_id (Optional[int]): The task the AMR is working on, None while idle.
+    """
+    state: str
+    start_time: float
+    end_time: float
+    task_id: Optional[int]
+
+
+class Violation(NamedTuple):
+    """
+    A problem found while replaying a schedule.
+
+    Attributes:
+        kind (str): One of the Violation kinds defined on Simulation.
+        amr_id (int): The AMR the violation occurred on.
+        task_id (int): The task the violation refers to.
+        time (float): The simulation time at which the violation was detected.
+        amount (float): The size of the violation in seconds (0 if not applicable).
+    """
+    kind: str
+    amr_id: int
+    task_id: int
+    time: float
+    amount: float
+
+
+class Simulation:
+    """
+    Discrete-event simulator replaying a SchedulingOutput against its DataInput.
+
+    Every assignment is split into three events: the departure towards the
+    start location, the pickup and the dropoff. Each AMR executes its
+    assignments sequentially, so the event heap only ever holds the next
+    pending event of every AMR, which keeps it as small as the fleet.
+
+    Travel times are not taken from the schedule: every empty leg is
+    recomputed from the end of the task the AMR executed before it in replay
+    order, the first one from the start location. Assignments whose stored
+    duration disagrees are reported.
+
+    If an assignment is scheduled to start while the AMR is still busy, the
+    replay delays it until the AMR is free and reports a conflict. Time windows
+    are checked against these realized times.
+
+    Attributes:
+        data_input (DataInput): The data input the schedule refers to.
+        record_timelines (bool): Whether per-AMR state timelines are recorded.
+        timelines (Dict[int, List[StateSegment]]): The state timeline of each AMR.
+        busy_time (Dict[int, float]): The time each AMR spent travelling or executing.
+        utilization (Dict[int, float]): The busy time of each AMR relative to the makespan.
+        violations (List[Violation]): All violations found during the replay.
+        makespan (float): The time at which the last AMR finished.
+        events_processed (int): The number of events taken from the event heap.
+    """
+
+    CONFLICT = "conflict"
+    DUPLICATE_TASK = "duplicate_task"
+    UNKNOWN_TASK = "unknown_task"
+    UNKNOWN_AMR = "unknown_amr"
+    EARLY_START = "early_start"
+    LATE_FINISH = "late_finish"
+    DURATION_MISMATCH = "duration_mismatch"
+
+    # stored durations may deviate this much (in seconds) from the recomputed ones
+    DURATION_TOLERANCE = 1e-6
+
+    _DEPART = 0
+    _PICKUP = 1
+    _DROPOFF = 2
+
+    def __init__(self, data_input: DataInput, record_timelines: bool = True, cost_cache: CostCache = None):
+        """
+        Initializes the Simulation object with the given DataInput.
+
+        Args:
+            data_input (DataInput): The data input the replayed schedules refer to.
+            record_timelines (bool): Whether to record the state timeline of every AMR.
+                Disabling it saves memory on very large replays.
+            cost_cache (CostCache): The cache travel times are recomputed with
+                (default: a new cache over the data input's distance model).
+        """
+        self.data_input = data_input
+        self.record_timelines = record_timelines
+        self.cost_cache = cost_cache if cost_cache is not None else CostCache(
+            data_input.distance_model)
+
+        self.timelines = None
+        self.busy_time = None
+        self.utilization = None
+        self.violations = None
+        self.makespan = None
+        self.events_processed = None
+
+    def run(self, scheduling_output: SchedulingOutput):
+        """
+        Replays the given scheduling output and populates the results.
+
+        Args:
+            scheduling_output (SchedulingOutput): The schedule to replay.
+        """
+        # the replay allocates millions of short-lived tuples but no reference
+        # cycles, so the cyclic garbage collector only costs time here
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._replay(scheduling_output)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _replay(self, scheduling_output: SchedulingOutput):
+        self.timelines = {amr.id: [] for amr in self.data_input.amrs}
+        self.busy_time = {amr.id: 0.0 for amr in self.data_input.amrs}
+        self.utilization = {}
+        self.violations = []
+        self.makespan = 0.0
+        self.events_processed = 0
+
+        routes = self._prepare_routes(scheduling_output)
+
+        # per AMR: index of the current assignment, time the AMR becomes free
+        position = {}
+        free_at = {}
+        realized_start = {}
+
+        heap = []
+        for amr_id, route in routes.items():
+            position[amr_id] = 0
+            free_at[amr_id] = 0.0
+            heap.append((route[0][0], amr_id, Simulation._DEPART))
+        heapq.heapify(heap)
+
+        # bypasses the NamedTuple constructor, which dominates large replays
+        segment = tuple.__new__
+        record = self.record_timelines
+        timelines = self.timelines
+        busy_time = self.busy_time
+        violations = self.violations
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        events = 0
+
+        while heap:
+            time, amr_id, kind = heappop(heap)
+            events += 1
+
+            route = routes[amr_id]
+            start_time, task_id, empty_duration, duration, task = route[position[amr_id]]
+
+            if kind == Simulation._DEPART:
+                last_free = free_at[amr_id]
+                if time < last_free:
+                    violations.append(Violation(
+                        Simulation.CONFLICT, amr_id, task_id, time, last_free - time))
+                    heappush(heap, (last_free, amr_id, Simulation._DEPART))
+                    continue
+
+                if record:
+                    if time > last_free:
+                        timelines[amr_id].append(segment(
+                            StateSegment, (AMRState.IDLE, last_free, time, None)))
+                    if empty_duration > 0:
+                        timelines[amr_id].append(segment(
+                            StateSegment, (AMRState.EMPTY_TRAVEL, time, time + empty_duration, task_id)))
+
+                realized_start[amr_id] = time
+                heappush(heap, (time + empty_duration, amr_id, Simulation._PICKUP))
+
+            elif kind == Simulation._PICKUP:
+                earliest_start = task.time_window.earliest_start
+                if time < earliest_start:
+                    violations.append(Violation(
+                        Simulation.EARLY_START, amr_id, task_id, time, earliest_start - time))
+
+                # the dropoff is derived from the departure, so that a schedule
+                # computed as start_time + duration replays without rounding drift
+                end_time = realized_start[amr_id] + duration
+
+                if record:
+                    timelines[amr_id].append(segment(
+                        StateSegment, (AMRState.EXECUTION, time, end_time, task_id)))
+
+                heappush(heap, (end_time, amr_id, Simulation._DROPOFF))
+
+            else:
+                latest_finish = task.time_window.latest_finish
+                if time > latest_finish:
+                    violations.append(Violation(
+                        Simulation.LATE_FINISH, amr_id, task_id, time, time - latest_finish))
+
+                busy_time[amr_id] += time - realized_start[amr_id]
+                free_at[amr_id] = time
+
+                index = position[amr_id] + 1
+                if index < len(route):
+                    position[amr_id] = index
+                    heappush(heap, (route[index][0], amr_id, Simulation._DEPART))
+
+        self.events_processed = events
+        self.makespan = max(free_at.values(), default=0.0)
+
+        for amr_id, busy in busy_time.items():
+            self.utilization[amr_id] = busy / self.makespan if self.makespan > 0 else 0.0
+
+    def _prepare_routes(self, scheduling_output: SchedulingOutput) -> Dict[int, list]:
+        """
+        Converts the assignments into per-AMR routes sorted by start time.
+
+        Each route entry is a tuple of (start_time, task_id, empty_duration,
+        duration, task), with the durations recomputed in route order.
+        Assignments referring to unknown AMRs, unknown tasks or to tasks that
+        were already assigned are reported and skipped.
+        """
+        routes = {}
+        seen_tasks = set()
+        get_task = self.data_input.get_task_by_id
+        travel_time = self.cost_cache.travel_time
+        tolerance = Simulation.DURATION_TOLERANCE
+
+        for amr_id, assignments in scheduling_output.assignments.items():
+            if len(assignments) == 0:
+                continue
+
+            amr = self.data_input.get_amr_by_id(amr_id)
+            if amr is None:
+                for assignment in assignments:
+                    self.violations.append(Violation(
+                        Simulation.UNKNOWN_AMR, amr_id, assignment.task_id, assignment.start_time, 0.0))
+                continue
+
+            kinematics = amr.kinematics
+            last_location = SchedulingOutput.START_LOCATION
+            route = []
+
+            for assignment in sorted(assignments, key=attrgetter('start_time')):
+                task_id = assignment.task_id
+                task = get_task(task_id)
+
+                if task is None:
+                    self.violations.append(Violation(
+                        Simulation.UNKNOWN_TASK, amr_id, task_id, assignment.start_time, 0.0))
+                    continue
+
+                if task_id in seen_tasks:
+                    self.violations.append(Violation(
+                        Simulation.DUPLICATE_TASK, amr_id, task_id, assignment.start_time, 0.0))
+                    continue
+                seen_tasks.add(task_id)
+
+                empty_duration = travel_time(kinematics, last_location, task.start_location)
+                duration = empty_duration + travel_time(
+                    kinematics, task.start_location, task.end_location)
+                last_location = task.end_location
+
+                if abs(assignment.duration - duration) > tolerance:
+                    self.violations.append(Violation(
+                        Simulation.DURATION_MISMATCH, amr_id, task_id, assignment.start_time,
+                        assignment.duration - duration))
+
+                route.append((assignment.start_time, task_id,
+                              empty_duration, duration, task))
+
+            if len(route) > 0:
+                routes[amr_id] = route
+
+        return routes
+
+    def __str__(self):
+        """
+        Returns a string representation of the Simulation results.
+
+        Returns:
+            str: String representation of the Simulation results.
+        """
+        counts = {}
+        for violation in self.violations:
+            counts[violation.kind] = counts.get(violation.kind, 0) + 1
+
+        mean_utilization = 0.0
+        if len(self.utilization) > 0:
+            mean_utilization = sum(self.utilization.values()) / len(self.utilization)
+
+        simulation_str = "Simulation Results:\n"
+        simulation_str += f"    Makespan: {self.makespan:.2f} seconds\n"
+        simulation_str += f"    Events Processed: {self.events_processed}\n"
+        simulation_str += f"    Mean Utilization: {mean_utilization:.2%}\n"
+        simulation_str += f"    Violations: {len(self.violations)}\n"
+        for kind, count in sorted(counts.items()):
+            simulation_str += f"        {kind}: {count}\n"
+        return simulation_str
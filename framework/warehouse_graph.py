@@ -0,0 +1,271 @@
+import os
+import json
+import math
+import mmap
+import heapq
+import hashlib
+
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+
+Location = Tuple[float, float]
+
+
+class WarehouseGraphException(Exception):
+    pass
+
+
+class WarehouseGraph:
+    """
+    A graph of the paths AMRs can drive on the shop floor.
+
+    The graph file is a JSON object with a list of nodes and a list of
+    undirected edges:
+
+        {
+            "nodes": [{"id": 0, "x": 0, "y": 0}, ...],
+            "edges": [[0, 1], [1, 2, 12.5], ...]
+        }
+
+    The optional third entry of an edge is its length in meters. It defaults to
+    the straight-line distance between the nodes and must not be shorter, so
+    that Euclidean distances stay a lower bound of graph distances.
+
+    Attributes:
+        graph_file_path (str): The path to the graph file.
+        coordinates (List[Tuple[float, float]]): The location of every node, by node index.
+        adjacency (List[List[Tuple[int, float]]]): The neighbours and edge lengths of every node.
+    """
+
+    def __init__(self, graph_file_path: str):
+        """
+        Initializes the WarehouseGraph object by reading the graph file.
+
+        Args:
+            graph_file_path (str): The path to the graph file.
+
+        Raises:
+            WarehouseGraphException: If the graph file is inconsistent.
+        """
+        self.graph_file_path = graph_file_path
+        self.coordinates: List[Location] = []
+        self.adjacency: List[List[Tuple[int, float]]] = []
+
+        with open(graph_file_path, 'rb') as file:
+            content = file.read()
+        self.content_hash = hashlib.sha256(content).hexdigest()
+
+        data = json.loads(content)
+
+        index_by_id = {}
+        for node in data['nodes']:
+            index_by_id[node['id']] = len(self.coordinates)
+            self.coordinates.append((node['x'], node['y']))
+            self.adjacency.append([])
+
+        if len(self.coordinates) == 0:
+            raise WarehouseGraphException(f"{graph_file_path} contains no nodes.")
+
+        for edge in data['edges']:
+            try:
+                u = index_by_id[edge[0]]
+                v = index_by_id[edge[1]]
+            except KeyError as e:
+                raise WarehouseGraphException(
+                    f"Edge {edge} refers to an unknown node.") from e
+
+            straight_line = math.dist(self.coordinates[u], self.coordinates[v])
+            length = edge[2] if len(edge) > 2 else straight_line
+            if length < straight_line - 1e-9:
+                raise WarehouseGraphException(
+                    f"Edge {edge} is shorter than the straight line between its nodes.")
+
+            self.adjacency[u].append((v, length))
+            self.adjacency[v].append((u, length))
+
+    def nearest_node(self, location: Location) -> Tuple[int, float]:
+        """
+        Returns the node closest to a location.
+
+        Args:
+            location (Tuple[float, float]): The location coordinates (x, y).
+
+        Returns:
+            Tuple[int, float]: The node index and the straight-line distance to it.
+        """
+        distances = list(map(math.dist, self.coordinates,
+                         [location] * len(self.coordinates)))
+        node = min(range(len(distances)), key=distances.__getitem__)
+        return node, distances[node]
+
+
+_worker_adjacency = None
+
+
+def _init_worker(adjacency):
+    global _worker_adjacency
+    _worker_adjacency = adjacency
+
+
+def _dijkstra(adjacency, source: int, targets: Sequence[int]) -> List[float]:
+    """
+    Returns the shortest path lengths from source to every target.
+    """
+    distances = {source: 0.0}
+    remaining = set(targets)
+    remaining.discard(source)
+    heap = [(0.0, source)]
+    settled = set()
+
+    while heap and remaining:
+        distance, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+        remaining.discard(node)
+
+        for neighbour, length in adjacency[node]:
+            candidate = distance + length
+            if candidate < distances.get(neighbour, math.inf):
+                distances[neighbour] = candidate
+                heapq.heappush(heap, (candidate, neighbour))
+
+    return [distances.get(target, math.inf) for target in targets]
+
+
+def _shortest_paths_chunk(job) -> List[List[float]]:
+    sources, targets = job
+    return [_dijkstra(_worker_adjacency, source, targets) for source in sources]
+
+
+class GraphDistanceModel:
+    """
+    Shortest-path distances on a WarehouseGraph between a fixed set of locations.
+
+    Every location is connected to its nearest graph node by a straight line.
+    The distances between all pairs of locations are computed once with
+    Dijkstra's algorithm, spread over worker processes, and stored as a
+    row-major float64 matrix in a file. The file is memory-mapped, so lookups
+    are O(1) and later runs on the same graph and locations reuse it.
+
+    Attributes:
+        graph (WarehouseGraph): The underlying graph.
+        matrix_path (str): The path of the memory-mapped distance matrix.
+        size (int): The number of locations.
+    """
+
+    CACHE_PATH = os.path.join(os.getcwd(), ".cache", "graphs")
+
+    # sources handed to a worker process at once
+    CHUNK_SOURCES = 16
+
+    def __init__(self, graph: WarehouseGraph, locations: Sequence[Location], processes: int = None,
+                 cache_path: str = None):
+        """
+        Initializes the GraphDistanceModel and computes or loads the distance matrix.
+
+        Args:
+            graph (WarehouseGraph): The graph to route on.
+            locations (Sequence[Tuple[float, float]]): The locations distances are requested for.
+            processes (int): The number of worker processes (default: number of CPUs).
+            cache_path (str): The folder for matrix files (default: CACHE_PATH).
+
+        Raises:
+            WarehouseGraphException: If the graph does not connect all locations.
+        """
+        self.graph = graph
+
+        # sorted, so that the same set of locations always maps to the same file
+        unique_locations = sorted(set((float(x), float(y)) for x, y in locations))
+        self._index: Dict[Location, int] = {
+            location: i for i, location in enumerate(unique_locations)}
+        self.size = len(unique_locations)
+
+        cache_path = cache_path if cache_path is not None else GraphDistanceModel.CACHE_PATH
+        os.makedirs(cache_path, exist_ok=True)
+
+        digest = hashlib.sha256(graph.content_hash.encode())
+        digest.update(json.dumps(unique_locations).encode())
+        self.matrix_path = os.path.join(cache_path, digest.hexdigest() + '.bin')
+
+        if not os.path.exists(self.matrix_path):
+            self._write_matrix(unique_locations, processes)
+
+        self._open_matrix()
+
+    def _open_matrix(self):
+        with open(self.matrix_path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._matrix = memoryview(self._mmap).cast('d')
+
+    def __getstate__(self):
+        # the mapping is not picklable; other processes map the same file instead
+        state = self.__dict__.copy()
+        del state['_mmap']
+        del state['_matrix']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open_matrix()
+
+    def distance(self, start_location: Location, end_location: Location) -> float:
+        """
+        Returns the shortest-path distance between two locations.
+
+        Args:
+            start_location (Tuple[float, float]): The starting location coordinates (x, y).
+            end_location (Tuple[float, float]): The ending location coordinates (x, y).
+
+        Returns:
+            float: The distance in meters.
+
+        Raises:
+            WarehouseGraphException: If a location was not part of the precomputation.
+        """
+        try:
+            return self._matrix[self._index[start_location] * self.size + self._index[end_location]]
+        except KeyError as e:
+            raise WarehouseGraphException(
+                f"Location {e.args[0]} has no precomputed graph distances.") from e
+
+    def _write_matrix(self, locations: List[Location], processes: int):
+        snapped = [self.graph.nearest_node(location) for location in locations]
+        nodes = sorted(set(node for node, _ in snapped))
+        node_position = {node: i for i, node in enumerate(nodes)}
+
+        jobs = [(nodes[i:i + GraphDistanceModel.CHUNK_SOURCES], nodes)
+                for i in range(0, len(nodes), GraphDistanceModel.CHUNK_SOURCES)]
+
+        processes = processes if processes is not None else os.cpu_count() or 1
+        processes = min(processes, len(jobs))
+
+        if processes > 1:
+            from multiprocessing import Pool
+
+            with Pool(processes, initializer=_init_worker, initargs=(self.graph.adjacency,)) as pool:
+                results = pool.map(_shortest_paths_chunk, jobs)
+        else:
+            _init_worker(self.graph.adjacency)
+            results = list(map(_shortest_paths_chunk, jobs))
+
+        node_distances = [row for chunk in results for row in chunk]
+
+        for node_i, row_distances in zip(nodes, node_distances):
+            if math.inf in row_distances:
+                node_j = nodes[row_distances.index(math.inf)]
+                raise WarehouseGraphException(
+                    f"Node {self.graph.coordinates[node_j]} cannot be reached from node "
+                    f"{self.graph.coordinates[node_i]}, but both are nearest to task locations.")
+
+        temporary_path = self.matrix_path + '.%d.tmp' % os.getpid()
+        with open(temporary_path, 'wb') as file:
+            for i, (node_i, snap_i) in enumerate(snapped):
+                row_distances = node_distances[node_position[node_i]]
+                row = array('d', (
+                    0.0 if i == j else snap_i + row_distances[node_position[node_j]] + snap_j
+                    for j, (node_j, snap_j) in enumerate(snapped)))
+                row.tofile(file)
+
+        os.replace(temporary_path, self.matrix_path)
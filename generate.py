@@ -1,24 +1,10 @@
-from itertools import product
-
-from generator.generator import Generator
-
-
-def generate_many():
-    number_of_tasks = [
-        100, 200, 300, 400, 500
-    ]
-
-    batch_sizes = [
-        10, 20, 40,
-        None  # = inf
-    ]
-
-    for t, b in product(number_of_tasks, batch_sizes):
-        Generator(tasks=t, batch_size=b)
+import sys
 
 
 if __name__ == "__main__":
 
-    # generate_many()
+    # shortcut for `python cli.py generate`, e.g. --tasks 100 200 --batch-sizes 10 none
+    import cli
 
-    Generator(tasks=100, batch_size=None)
+    args = cli.create_parser().parse_args(['generate'] + sys.argv[1:])
+    args.handler(args)
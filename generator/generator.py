@@ -1,12 +1,12 @@
 import os
 import json
-import pandas as pd
 
 
 class Generator:
 
-    def __init__(self, tasks, batch_size=None):
+    def __init__(self, tasks, batch_size=None, root=None):
         self.batch_size = batch_size
+        self.root = root if root is not None else os.getcwd()
 
         customer_instances = tasks * 2
 
@@ -15,7 +15,7 @@ class Generator:
 
         folder = 'homberger_{}_customer_instances'.format(customer_instances)
         self.path = os.path.join(
-            os.getcwd(), 'generator', 'homberger', folder)
+            self.root, 'generator', 'homberger', folder)
 
         for filename in os.listdir(self.path):
             filepath = os.path.join(self.path, filename)
@@ -27,11 +27,14 @@ class Generator:
                 filename.split('.')[0], number_of_tasks)
 
             output_filepath = os.path.join(
-                os.getcwd(), 'datasets', 'batches', output_filename)
+                self.root, 'datasets', 'batches', output_filename)
 
             self.write_json(obj, output_filepath)
 
     def load_dataframe(self, filepath: str):
+        # pandas is only needed here and is slow to import
+        import pandas as pd
+
         with open(filepath, 'r') as file:
             file_content = file.read()
 
@@ -67,7 +70,7 @@ class Generator:
 
             return df
 
-    def create_object(self, df: pd.DataFrame):
+    def create_object(self, df: 'pd.DataFrame'):
         obj = dict()
         obj['batches'] = []
 
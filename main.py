@@ -1,20 +1,33 @@
+import sys
 import time
-import os
 from framework.data_input import DataInput
 from framework.evaluation import Evaluation
+from framework.result_cache import ResultCache
 
-from optimization.round_robin import RoundRobin
 
+def execute(batch_file: str, amr_file: str, OptimizerImpl, optimizer_params: dict = None,
+            result_cache: ResultCache = None, graph_file: str = None) -> Evaluation:
 
-def execute(batch_file: str, amr_file: str, OptimizerImpl) -> Evaluation:
+    optimizer_params = optimizer_params or {}
 
-    data_input = DataInput(batch_file, amr_file)
+    if result_cache is not None:
+        key = result_cache.key(
+            DataInput.get_batch_file_path(batch_file),
+            DataInput.get_amr_file_path(amr_file),
+            OptimizerImpl, optimizer_params,
+            DataInput.get_graph_file_path(graph_file) if graph_file is not None else None)
+
+        entry = result_cache.get(key)
+        if entry is not None:
+            return Evaluation.create_from_dict(entry['evaluation'])
+
+    data_input = DataInput(batch_file, amr_file, graph_file)
 
     # --------------------------
 
     start_time = time.time()
 
-    optimizer = OptimizerImpl()
+    optimizer = OptimizerImpl(**optimizer_params)
     scheduling_output = optimizer.run(data_input)
 
     end_time = time.time()
@@ -24,16 +37,18 @@ def execute(batch_file: str, amr_file: str, OptimizerImpl) -> Evaluation:
     evaluation = Evaluation(data_input)
     evaluation.set_execution_time(end_time - start_time)
     evaluation.evaluate(scheduling_output)
+    evaluation.set_lower_bounds(optimizer.lower_bounds.total())
+
+    if result_cache is not None:
+        result_cache.put(key, evaluation.to_dict(), scheduling_output.to_dict())
 
     return evaluation
 
 
 if __name__ == "__main__":
 
-    batch_path = os.path.join(os.getcwd(), 'datasets', 'batches')
-    for batch_file in sorted(os.listdir(batch_path)):
-
-        evaluation = execute(batch_file, 'amrs_15.json', RoundRobin)
+    # shortcut for `python cli.py run`, which runs RoundRobin on all batch files
+    import cli
 
-        print("\n\nFile ", batch_file)
-        print(evaluation)
+    args = cli.create_parser().parse_args(['run'] + sys.argv[1:])
+    args.handler(args)
@@ -11,6 +11,8 @@ class Kinematics:
         acceleration (float): The maximum acceleration in meters per second squared.
         load_time (float): The load time in seconds.
         unload_time (float): The unload time in seconds.
+        distance_model: Optional model with a distance(start_location, end_location) method
+            replacing the straight-line distance, e.g. a GraphDistanceModel.
     """
 
     def __init__(self, velocity: float, deceleration: float, acceleration: float, load_time: float, unload_time: float):
@@ -29,6 +31,17 @@ class Kinematics:
         self.acceleration = acceleration
         self.load_time = load_time
         self.unload_time = unload_time
+        self.distance_model = None
+
+    @property
+    def motion_profile(self) -> Tuple[float, float, float]:
+        """
+        The parameters travel times depend on. AMRs sharing a motion profile share their travel times.
+
+        Returns:
+            Tuple[float, float, float]: The velocity, acceleration and deceleration.
+        """
+        return (self.velocity, self.acceleration, self.deceleration)
 
     @staticmethod
     def distance(start_location: Tuple[float, float], end_location: Tuple[float, float]) -> float:
@@ -44,6 +57,21 @@ class Kinematics:
         """
         return math.sqrt((start_location[0] - end_location[0]) ** 2 + (start_location[1] - end_location[1]) ** 2)
 
+    def path_distance(self, start_location: Tuple[float, float], end_location: Tuple[float, float]) -> float:
+        """
+        Calculate the distance an AMR travels between two locations, using the distance model if set.
+
+        Args:
+            start_location (Tuple[float, float]): The starting location coordinates (x, y).
+            end_location (Tuple[float, float]): The ending location coordinates (x, y).
+
+        Returns:
+            float: The distance in meters.
+        """
+        if self.distance_model is not None:
+            return self.distance_model.distance(start_location, end_location)
+        return Kinematics.distance(start_location, end_location)
+
     def calc_time(self, start_location: Tuple[float, float], end_location: Tuple[float, float]) -> float:
         """
         Calculate the time to move from start to stop.
@@ -52,12 +80,24 @@ class Kinematics:
             start_location (Tuple[float, float]): The starting location coordinates (x, y).
             end_location (Tuple[float, float]): The ending location coordinates (x, y).
 
+        Returns:
+            float: The time in seconds.
+        """
+        return self.calc_time_for_distance(self.path_distance(start_location, end_location))
+
+    def calc_time_for_distance(self, distance: float) -> float:
+        """
+        Calculate the time to travel the given distance.
+        If acceleration and deceleration are equal, the time never decreases with the distance.
+
+        Args:
+            distance (float): The distance in meters.
+
         Returns:
             float: The time in seconds.
         """
         distance_acc = (self.velocity ** 2) / (2 * self.acceleration)
         distance_break = (self.velocity ** 2) / (2 * abs(self.deceleration))
-        distance = Kinematics.distance(start_location, end_location)
         distance_threshold = distance_break + distance_acc
         time = 0
 
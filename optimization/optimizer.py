@@ -2,23 +2,59 @@ from abc import ABC, abstractmethod
 
 from model.batch import Batch
 
+from framework.cost_cache import CostCache
 from framework.data_input import DataInput
+from framework.lower_bounds import Bounds, LowerBounds
 from framework.scheduling_output import SchedulingOutput
 
+from optimization.warm_start import WarmStart
+
 
 class Optimizer(ABC):
 
-    def run(self, data_input: DataInput) -> SchedulingOutput:
+    def run(self, data_input: DataInput, cost_cache: CostCache = None) -> SchedulingOutput:
         self.data_input = data_input
-        self.scheduling_output = SchedulingOutput(self.data_input)
+        self.cost_cache = cost_cache if cost_cache is not None else CostCache(
+            data_input.distance_model)
+        self.scheduling_output = SchedulingOutput(self.data_input, self.cost_cache)
+        self.warm_start = WarmStart(self.scheduling_output, self.cost_cache)
+        self._lower_bounds = None
 
         self.init_optimization()
 
         for batch in data_input.batches:
+            self.warm_start.begin_batch(batch)
             self.process_batch(batch)
 
         return self.scheduling_output
 
+    @property
+    def lower_bounds(self) -> LowerBounds:
+        """
+        The lower bounds of the data input being optimized.
+
+        They are only computed when first needed, so optimizers that never use
+        them do not spend their execution time on them.
+        """
+        if self._lower_bounds is None:
+            self._lower_bounds = LowerBounds(self.data_input)
+        return self._lower_bounds
+
+    def within_gap(self, batch: Batch, makespan: float, tolerance: float) -> bool:
+        """
+        Stopping criterion for searches: whether a makespan is close enough to the batch's lower bound.
+
+        Args:
+            batch (Batch): The batch being optimized.
+            makespan (float): The makespan of the best solution found for the batch.
+            tolerance (float): The accepted relative gap, e.g. 0.05 for 5%.
+
+        Returns:
+            bool: True if the relative gap is at most the tolerance.
+        """
+        bound = self.lower_bounds.for_batch(batch).total_makespan
+        return Bounds.gap(makespan, bound) <= tolerance
+
     @abstractmethod
     def init_optimization(self) -> None:
         pass
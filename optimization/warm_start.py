@@ -0,0 +1,131 @@
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+from model.batch import Batch
+
+from framework.cost_cache import CostCache
+from framework.scheduling_output import SchedulingOutput
+
+
+class WarmStart:
+    """
+    Carries the solution of previous batches into the next call of process_batch.
+
+    When a new batch arrives, every assignment starting before the batch's
+    release time is considered started and stays frozen. Only the remaining
+    suffix of each AMR's route is open for re-optimization, so the work per
+    batch depends on the batch size rather than on the length of the history.
+
+    Attributes:
+        scheduling_output (SchedulingOutput): The solution built so far.
+        cost_cache (CostCache): Travel times and distances cached across batches.
+        state (Dict[str, Any]): Free storage for optimizers to keep their own
+            search structures (e.g. neighbourhoods) between batches.
+        batch (Batch): The batch currently being processed.
+        release_time (float): The time from which assignments may still be changed.
+    """
+
+    def __init__(self, scheduling_output: SchedulingOutput, cost_cache: CostCache):
+        """
+        Initializes the WarmStart object with the solution it tracks.
+
+        Args:
+            scheduling_output (SchedulingOutput): The solution built so far.
+            cost_cache (CostCache): The cache shared with the scheduling output.
+        """
+        self.scheduling_output = scheduling_output
+        self.cost_cache = cost_cache
+        self.state: Dict[str, Any] = {}
+
+        self.batch = None
+        self.release_time = 0.0
+
+    def begin_batch(self, batch: Batch):
+        """
+        Advances the release time to the arrival of the given batch.
+
+        The release time is the earliest start of the batch's tasks and never
+        moves backwards.
+
+        Args:
+            batch (Batch): The batch about to be processed.
+        """
+        self.batch = batch
+
+        if len(batch.tasks) > 0:
+            arrival = min(task.time_window.earliest_start for task in batch.tasks)
+            self.release_time = max(self.release_time, arrival)
+
+    def frozen_length(self, amr_id: int) -> int:
+        """
+        Returns the number of assignments of an AMR that have already started.
+        Relies on the route being ordered by start time.
+
+        Args:
+            amr_id (int): The AMR to look at.
+
+        Returns:
+            int: The length of the frozen prefix of the AMR's route.
+        """
+        return bisect_left(self.scheduling_output.assignments.get(amr_id, []),
+                           self.release_time, key=lambda ass: ass.start_time)
+
+    def open_suffix(self, amr_id: int) -> List[int]:
+        """
+        Returns the tasks of an AMR that have not started yet.
+
+        Args:
+            amr_id (int): The AMR to look at.
+
+        Returns:
+            List[int]: The task ids of the open suffix in route order.
+        """
+        route = self.scheduling_output.assignments.get(amr_id, [])
+        return [ass.task_id for ass in route[self.frozen_length(amr_id):]]
+
+    def available_from(self, amr_id: int) -> Tuple[float, Tuple[float, float]]:
+        """
+        Returns when and where the frozen prefix of an AMR's route ends.
+
+        Args:
+            amr_id (int): The AMR to look at.
+
+        Returns:
+            Tuple[float, Tuple[float, float]]: The time and location (x, y) at
+                which the AMR finishes its last started assignment.
+        """
+        length = self.frozen_length(amr_id)
+        if length == 0:
+            return 0.0, SchedulingOutput.START_LOCATION
+
+        last_assignment = self.scheduling_output.assignments[amr_id][length - 1]
+        last_task = self.scheduling_output.data_intput.get_task_by_id(
+            last_assignment.task_id)
+
+        return last_assignment.start_time + last_assignment.duration, last_task.end_location
+
+    def replace_suffix(self, amr_id: int, task_ids: List[int]):
+        """
+        Replaces the open suffix of an AMR's route with the given tasks.
+
+        The frozen prefix is kept as is. Each new task starts once the AMR has
+        finished the previous one, including its empty travel, but never before
+        the release time or the task's earliest start.
+
+        Args:
+            amr_id (int): The AMR whose route is changed.
+            task_ids (List[int]): The task ids of the new suffix in route order.
+        """
+        available_time, _ = self.available_from(amr_id)
+        self.scheduling_output.truncate(amr_id, self.frozen_length(amr_id))
+
+        for task_id in task_ids:
+            task = self.scheduling_output.data_intput.get_task_by_id(task_id)
+            start_time = max(available_time, self.release_time,
+                             task.time_window.earliest_start)
+
+            self.scheduling_output.add_assignment(amr_id, task_id, start_time)
+
+            # the duration covers the empty travel to the task and its execution
+            assignment = self.scheduling_output.assignments[amr_id][-1]
+            available_time = assignment.start_time + assignment.duration
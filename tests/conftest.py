@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from framework.data_input import DataInput  # noqa: E402
+from optimization.optimizer import Optimizer  # noqa: E402
+
+DataInput.DATASETS_PATH = os.path.join(ROOT, 'datasets')
+
+BATCH_FILE = 'tasks_100_batchsize_None_C1_2_1.json'
+AMR_FILE = 'amrs_15.json'
+
+
+class InOrder(Optimizer):
+    """
+    Assigns the tasks of every batch to the AMRs in turn.
+    """
+
+    def init_optimization(self) -> None:
+        self.next_amr = 0
+
+    def process_batch(self, batch) -> None:
+        for task in batch.tasks:
+            amr = self.data_input.amrs[self.next_amr % len(self.data_input.amrs)]
+            self.scheduling_output.add_assignment(amr.id, task.id)
+            self.next_amr += 1
+
+
+@pytest.fixture
+def data_input():
+    return DataInput(BATCH_FILE, AMR_FILE)
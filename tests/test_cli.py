@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+from conftest import ROOT
+
+import cli
+
+
+def test_startup_does_not_load_heavy_modules():
+    code = ("import sys, cli, framework.fleet_sweep\n"
+            "print(','.join(module for module in ('pandas', 'framework.warehouse_graph', "
+            "'framework.schedule_io', 'multiprocessing') if module in sys.modules))")
+
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                            stdin=subprocess.DEVNULL, capture_output=True, text=True).stdout
+
+    assert output.strip() == ''
+
+
+def test_generate_arguments():
+    args = cli.create_parser().parse_args(['generate', '--tasks', '100', '200', '--batch-sizes', '10', 'none'])
+
+    assert args.handler is cli.command_generate
+    assert args.tasks == [100, 200]
+    assert args.batch_sizes == ['10', 'none']
+    assert args.root == cli.ROOT
+
+
+def test_run_arguments():
+    args = cli.create_parser().parse_args(
+        ['--root', '/data', 'run', '--batch', 'a.json', 'b.json', '--amrs', 'amrs_30.json',
+         '--params', '{"seed": 1}', '--graph', 'grid.json', '--no-cache'])
+
+    assert args.handler is cli.command_run
+    assert args.root == '/data'
+    assert args.batch == ['a.json', 'b.json']
+    assert args.amrs == 'amrs_30.json'
+    assert args.params == {'seed': 1}
+    assert args.graph == 'grid.json'
+    assert args.no_cache
+    assert args.optimizer == cli.DEFAULT_OPTIMIZER
+
+
+def test_sweep_arguments():
+    args = cli.create_parser().parse_args(
+        ['sweep', '--batch', 'a.json', '--amrs', 'amrs_15.json', 'amrs_60.json', '--processes', '2'])
+
+    assert args.handler is cli.command_sweep
+    assert args.batch == 'a.json'
+    assert args.amrs == ['amrs_15.json', 'amrs_60.json']
+    assert args.processes == 2
+    assert args.params == {}
+
+
+def test_bench_arguments():
+    args = cli.create_parser().parse_args(['bench', '--optimizer', 'conftest:InOrder', '--repeat', '1'])
+
+    assert args.handler is cli.command_bench
+    assert args.repeat == 1
+    assert cli.load_optimizer(args.optimizer).__name__ == 'InOrder'
@@ -0,0 +1,53 @@
+from conftest import BATCH_FILE, InOrder
+
+from framework import fleet_sweep
+from framework.data_input import DataInput
+from framework.fleet_sweep import FleetSweep
+from main import execute
+from model.kinematics import Kinematics
+
+
+AMR_FILES = ['amrs_15.json', 'amrs_30.json']
+
+
+def test_primed_costs_match_kinematics(data_input, monkeypatch):
+    cost_cache = FleetSweep(BATCH_FILE, AMR_FILES, InOrder).build_cost_cache(data_input)
+    tasks = data_input.batches[0].tasks
+    profiles = {amr.kinematics.motion_profile: amr.kinematics for amr in data_input.amrs}
+
+    expected = {}
+    for kinematics in profiles.values():
+        for task in tasks:
+            expected[kinematics, task.start_location, task.end_location] = kinematics.calc_time(
+                task.start_location, task.end_location)
+            for other in tasks[:10]:
+                expected[kinematics, task.end_location, other.start_location] = kinematics.calc_time(
+                    task.end_location, other.start_location)
+
+    # primed legs must be served without measuring any distance again
+    def fail(*args):
+        raise AssertionError("distance of a primed leg recomputed")
+    monkeypatch.setattr(Kinematics, 'path_distance', fail)
+    monkeypatch.setattr(Kinematics, 'distance', fail)
+
+    for (kinematics, start_location, end_location), time in expected.items():
+        assert cost_cache.travel_time(kinematics, start_location, end_location) == time
+
+
+def test_workers_do_not_read_fleet_files(monkeypatch, tmp_path):
+    expected = [execute(BATCH_FILE, amr_file, InOrder).to_dict() for amr_file in AMR_FILES]
+
+    init_worker = fleet_sweep._init_worker
+
+    # like a spawned worker started in another folder, which does not find the datasets
+    def init_worker_elsewhere(data_input, cost_cache):
+        monkeypatch.setattr(DataInput, 'DATASETS_PATH', str(tmp_path))
+        init_worker(data_input, cost_cache)
+    monkeypatch.setattr(fleet_sweep, '_init_worker', init_worker_elsewhere)
+
+    results = FleetSweep(BATCH_FILE, AMR_FILES, InOrder).run(processes=1)
+
+    assert [result.amr_file for result in results] == AMR_FILES
+    for result, evaluation_dict in zip(results, expected):
+        assert result.evaluation.total_makespan == evaluation_dict['total_makespan']
+        assert result.evaluation.lateness == evaluation_dict['lateness']
@@ -0,0 +1,73 @@
+import math
+import random
+
+import pytest
+
+from conftest import BATCH_FILE, InOrder
+
+from framework.data_input import DataInput
+from framework.evaluation import Evaluation
+from framework.lower_bounds import LowerBounds, _OriginGrid
+from framework.scheduling_output import SchedulingOutput
+from model.kinematics import Kinematics
+
+
+@pytest.mark.parametrize('amr_file', ['amrs_15.json', 'amrs_30.json', 'amrs_60.json', 'amrs_120.json'])
+def test_bounds_do_not_exceed_achieved_metrics(amr_file):
+    data_input = DataInput(BATCH_FILE, amr_file)
+    scheduling_output = InOrder().run(data_input)
+
+    evaluation = Evaluation(data_input)
+    evaluation.evaluate(scheduling_output)
+    bounds = LowerBounds(data_input).total()
+
+    assert 0 < bounds.total_makespan <= evaluation.total_makespan
+    assert 0 < bounds.total_distance <= evaluation.total_distance
+    assert 0 <= bounds.lateness <= evaluation.lateness
+
+
+def brute_force(points, location, skip):
+    return min((math.dist(point, location) for index, point in enumerate(points) if index != skip),
+               default=math.inf)
+
+
+@pytest.mark.parametrize('points', [
+    [(float(random.Random(seed).randint(0, 100)), float(random.Random(seed + 1000).randint(0, 100)))
+     for seed in range(300)],
+    [(random.Random(seed).uniform(0, 100), 5.0) for seed in range(50)],
+    [(3.0, 3.0 * index) for index in range(20)],
+    [(7.0, 7.0)] * 10,
+    [(1.0, 2.0)],
+])
+def test_grid_matches_brute_force(points):
+    grid = _OriginGrid(points)
+    generator = random.Random(len(points))
+
+    for _ in range(200):
+        # some queries fall far outside the grid
+        location = (generator.uniform(-100, 200), generator.uniform(-100, 200))
+        skip = generator.choice([None, generator.randrange(len(points))])
+
+        assert grid.nearest_distance(location, skip) == pytest.approx(brute_force(points, location, skip))
+
+    for index, point in enumerate(points):
+        assert grid.nearest_distance(point, index) == pytest.approx(brute_force(points, point, index))
+
+
+def test_asymmetric_profiles_scan_all_origins(data_input):
+    kinematics = Kinematics(velocity=2.0, deceleration=-0.25, acceleration=4.0, load_time=0, unload_time=0)
+    for amr in data_input.amrs:
+        amr.kinematics = kinematics
+
+    lower_bounds = LowerBounds(data_input)
+    origins = [(None, SchedulingOutput.START_LOCATION)] + [
+        (task.id, task.end_location) for batch in data_input.batches for task in batch.tasks]
+
+    for task in data_input.batches[0].tasks[:20]:
+        distances = [math.dist(location, task.start_location)
+                     for task_id, location in origins if task_id != task.id]
+
+        distance, time = lower_bounds._shortest_empty_leg(task.id, task.start_location)
+
+        assert distance == pytest.approx(min(distances))
+        assert time == pytest.approx(min(map(kinematics.calc_time_for_distance, distances)))
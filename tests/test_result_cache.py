@@ -0,0 +1,65 @@
+import os
+import sys
+
+from conftest import BATCH_FILE, AMR_FILE, InOrder
+
+from framework.data_input import DataInput
+from framework.result_cache import ResultCache
+from main import execute
+
+
+class Subclass(InOrder):
+    pass
+
+
+def test_cached_run_is_served(tmp_path):
+    result_cache = ResultCache(str(tmp_path))
+
+    first = execute(BATCH_FILE, AMR_FILE, InOrder, result_cache=result_cache)
+    second = execute(BATCH_FILE, AMR_FILE, InOrder, result_cache=result_cache)
+
+    assert second.data_input is None
+    assert second.to_dict() == first.to_dict()
+    assert [name for name in os.listdir(tmp_path) if not name.endswith('.json')] == []
+
+
+def test_key_covers_base_classes_and_framework(tmp_path, monkeypatch):
+    result_cache = ResultCache(str(tmp_path))
+    paths = (DataInput.get_batch_file_path(BATCH_FILE), DataInput.get_amr_file_path(AMR_FILE))
+
+    key = result_cache.key(*paths, Subclass)
+    assert key == result_cache.key(*paths, Subclass)
+    assert key != result_cache.key(*paths, Subclass, {'seed': 1})
+
+    monkeypatch.setattr(ResultCache, 'SCHEMA_VERSION', ResultCache.SCHEMA_VERSION + 1)
+    assert key != result_cache.key(*paths, Subclass)
+
+    monkeypatch.setattr(ResultCache, '_source_digest', b'other framework code')
+    monkeypatch.setattr(ResultCache, 'SCHEMA_VERSION', ResultCache.SCHEMA_VERSION - 1)
+    assert key != result_cache.key(*paths, Subclass)
+
+
+def test_key_covers_modules_the_optimizer_imports(tmp_path, monkeypatch):
+    helper = tmp_path / 'cache_test_helper.py'
+    helper.write_text('def order(tasks):\n    return tasks\n')
+    (tmp_path / 'cache_test_optimizer.py').write_text(
+        'from conftest import InOrder\n'
+        'from cache_test_helper import order\n\n\n'
+        'class Custom(InOrder):\n'
+        '    pass\n')
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ('cache_test_helper', 'cache_test_optimizer'):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    from cache_test_optimizer import Custom
+
+    modules = [module.__name__ for module in ResultCache._optimizer_modules(Custom)]
+    assert 'cache_test_helper' in modules
+    assert 'optimization.warm_start' in modules
+
+    result_cache = ResultCache(str(tmp_path / 'cache'))
+    paths = (DataInput.get_batch_file_path(BATCH_FILE), DataInput.get_amr_file_path(AMR_FILE))
+    key = result_cache.key(*paths, Custom)
+
+    helper.write_text('def order(tasks):\n    return tasks[::-1]\n')
+    assert key != result_cache.key(*paths, Custom)
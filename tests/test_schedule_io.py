@@ -0,0 +1,78 @@
+import pytest
+
+from conftest import InOrder
+
+from framework.evaluation import Evaluation
+from framework.schedule_io import ScheduleFormatException, ScheduleIO
+
+
+def records(scheduling_output):
+    return [(ass.amr_id, ass.task_id, ass.start_time, ass.duration, ass.empty_travel_distance, ass.lateness)
+            for assignments in scheduling_output.assignments.values() for ass in assignments]
+
+
+@pytest.fixture
+def scheduling_output(data_input):
+    return InOrder().run(data_input)
+
+
+@pytest.mark.parametrize('write, read, filename', [
+    (ScheduleIO.write_binary, ScheduleIO.read_binary, 'schedule.bin'),
+    (ScheduleIO.write_jsonl, ScheduleIO.read_jsonl, 'schedule.jsonl'),
+])
+def test_round_trip(data_input, scheduling_output, tmp_path, monkeypatch, write, read, filename):
+    # several chunks, the last one partial
+    monkeypatch.setattr(ScheduleIO, 'CHUNK_RECORDS', 7)
+    path = str(tmp_path / filename)
+
+    write(scheduling_output, path)
+    restored = read(path, data_input)
+
+    assert records(restored) == records(scheduling_output)
+    assert list(restored.assignments) == list(scheduling_output.assignments)
+
+
+@pytest.mark.parametrize('filename', ['schedule.bin', 'schedule.jsonl'])
+def test_stored_evaluation_matches_evaluation(data_input, scheduling_output, tmp_path, filename):
+    path = str(tmp_path / filename)
+    if filename.endswith('.jsonl'):
+        ScheduleIO.write_jsonl(scheduling_output, path)
+    else:
+        ScheduleIO.write_binary(scheduling_output, path)
+
+    evaluation = Evaluation(data_input)
+    evaluation.evaluate(scheduling_output)
+
+    stored_evaluation = Evaluation(data_input)
+    stored_evaluation.evaluate_stored(path)
+
+    assert stored_evaluation.to_dict() == evaluation.to_dict()
+
+
+def test_invalid_binary_files_are_rejected(scheduling_output, tmp_path):
+    path = tmp_path / 'schedule.bin'
+    ScheduleIO.write_binary(scheduling_output, str(path))
+    content = path.read_bytes()
+
+    invalid = {
+        'magic': b'XXXX' + content[4:],
+        'version': ScheduleIO.HEADER.pack(ScheduleIO.MAGIC, ScheduleIO.VERSION + 1, 100)
+        + content[ScheduleIO.HEADER.size:],
+        'truncated': content[:-1],
+        'header': content[:ScheduleIO.HEADER.size - 1],
+    }
+
+    for data in invalid.values():
+        path.write_bytes(data)
+        with pytest.raises(ScheduleFormatException):
+            list(ScheduleIO.iter_binary(str(path)))
+
+
+@pytest.mark.parametrize('amr_id, task_id', [(999, 0), (0, 999)])
+def test_stored_schedule_with_unknown_ids_is_rejected(data_input, tmp_path, amr_id, task_id):
+    path = tmp_path / 'schedule.bin'
+    path.write_bytes(ScheduleIO.HEADER.pack(ScheduleIO.MAGIC, ScheduleIO.VERSION, 1)
+                     + ScheduleIO.RECORD.pack(amr_id, task_id, 0.0, 0.0, 0.0, 0.0))
+
+    with pytest.raises(ScheduleFormatException):
+        Evaluation(data_input).evaluate_stored(str(path))
@@ -0,0 +1,70 @@
+import pytest
+
+from conftest import InOrder
+
+from framework.evaluation import Evaluation
+from framework.scheduling_output import SchedulingOutput
+from framework.simulation import AMRState, Simulation
+
+
+def test_replay_matches_evaluation(data_input):
+    scheduling_output = InOrder().run(data_input)
+
+    evaluation = Evaluation(data_input)
+    evaluation.evaluate(scheduling_output)
+
+    simulation = Simulation(data_input)
+    simulation.run(scheduling_output)
+
+    assert simulation.makespan == evaluation.total_makespan
+    assert simulation.events_processed == 3 * 100
+    assert not any(violation.kind in (Simulation.CONFLICT, Simulation.DURATION_MISMATCH)
+                   for violation in simulation.violations)
+
+
+def test_unknown_amr_is_reported(data_input):
+    scheduling_output = InOrder().run(data_input)
+    scheduling_output.assignments[999] = scheduling_output.assignments.pop(0)
+
+    simulation = Simulation(data_input)
+    simulation.run(scheduling_output)
+
+    unknown = [violation for violation in simulation.violations
+               if violation.kind == Simulation.UNKNOWN_AMR]
+    assert len(unknown) == len(scheduling_output.assignments[999])
+
+
+def test_route_is_replayed_in_start_time_order(data_input):
+    scheduling_output = SchedulingOutput(data_input)
+    scheduling_output.add_assignment(5, 0, 1000)
+    scheduling_output.add_assignment(5, 1, 0)
+
+    simulation = Simulation(data_input)
+    simulation.run(scheduling_output)
+
+    kinematics = data_input.get_amr_by_id(5).kinematics
+    first, second = data_input.get_task_by_id(1), data_input.get_task_by_id(0)
+    timeline = simulation.timelines[5]
+
+    assert timeline[0] == (AMRState.EMPTY_TRAVEL, 0, kinematics.calc_time(
+        SchedulingOutput.START_LOCATION, first.start_location), 1)
+    second_departure = [segment for segment in timeline
+                        if segment.state == AMRState.EMPTY_TRAVEL and segment.task_id == 0][0]
+    assert second_departure.end_time - second_departure.start_time == pytest.approx(
+        kinematics.calc_time(first.end_location, second.start_location))
+
+    mismatched = {violation.task_id for violation in simulation.violations
+                  if violation.kind == Simulation.DURATION_MISMATCH}
+    assert mismatched == {0, 1}
+
+
+def test_tampered_duration_is_reported(data_input):
+    scheduling_output = InOrder().run(data_input)
+    scheduling_output.assignments[0][1].duration += 5.0
+
+    simulation = Simulation(data_input)
+    simulation.run(scheduling_output)
+
+    assert [(violation.kind, violation.task_id, violation.amount) for violation in simulation.violations
+            if violation.kind == Simulation.DURATION_MISMATCH] == [
+        (Simulation.DURATION_MISMATCH, scheduling_output.assignments[0][1].task_id, pytest.approx(5.0))]
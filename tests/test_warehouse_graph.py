@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from framework.cost_cache import CostCache
+from framework.warehouse_graph import GraphDistanceModel, WarehouseGraph, WarehouseGraphException
+from model.kinematics import Kinematics
+
+
+def write_graph(path, edges):
+    nodes = [{'id': 0, 'x': 0, 'y': 0}, {'id': 1, 'x': 10, 'y': 0},
+             {'id': 2, 'x': 10, 'y': 10}, {'id': 3, 'x': 50, 'y': 50}]
+    path.write_text(json.dumps({'nodes': nodes, 'edges': edges}))
+    return WarehouseGraph(str(path))
+
+
+def test_unreachable_locations_are_rejected(tmp_path):
+    graph = write_graph(tmp_path / 'graph.json', [[0, 1], [1, 2]])
+
+    with pytest.raises(WarehouseGraphException):
+        GraphDistanceModel(graph, [(0, 0), (50, 50)], processes=1, cache_path=str(tmp_path))
+
+    assert not list(tmp_path.glob('*.bin'))
+
+
+def test_travel_times_are_kept_per_distance_model(tmp_path):
+    graph = write_graph(tmp_path / 'graph.json', [[0, 1], [1, 2], [2, 3]])
+    locations = [(0.0, 0.0), (10.0, 10.0)]
+    distance_model = GraphDistanceModel(graph, locations, processes=1, cache_path=str(tmp_path))
+
+    straight = Kinematics(1.0, -1.0, 1.0, 0.0, 0.0)
+    routed = Kinematics(1.0, -1.0, 1.0, 0.0, 0.0)
+    routed.distance_model = distance_model
+
+    cost_cache = CostCache()
+    straight_time = cost_cache.travel_time(straight, *locations)
+    routed_time = cost_cache.travel_time(routed, *locations)
+
+    assert straight_time == straight.calc_time(*locations)
+    assert routed_time == routed.calc_time(*locations)
+    assert routed_time > straight_time
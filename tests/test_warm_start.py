@@ -0,0 +1,100 @@
+from conftest import InOrder
+
+from model.batch import Batch
+
+from framework.data_input import DataInput
+from framework.evaluation import Evaluation
+from framework.scheduling_output import SchedulingOutput
+from optimization.warm_start import WarmStart
+
+
+class KeepSuffix(InOrder):
+    """
+    Rebuilds the open suffix of every AMR without changing it before appending the batch.
+    """
+
+    def process_batch(self, batch) -> None:
+        for amr in self.data_input.amrs:
+            self.warm_start.replace_suffix(amr.id, self.warm_start.open_suffix(amr.id))
+
+        super().process_batch(batch)
+
+
+class ReverseSuffix(InOrder):
+    """
+    Appends the batch in turn and reverses the open suffix of every AMR.
+    Records the frozen prefixes before and after the changes.
+    """
+
+    def init_optimization(self) -> None:
+        super().init_optimization()
+        self.frozen = []
+
+    def process_batch(self, batch) -> None:
+        super().process_batch(batch)
+
+        before = self._frozen_tasks()
+
+        for amr in self.data_input.amrs:
+            self.warm_start.replace_suffix(
+                amr.id, list(reversed(self.warm_start.open_suffix(amr.id))))
+
+        self.frozen.append((before, self._frozen_tasks()))
+
+    def _frozen_tasks(self):
+        return {amr.id: [ass.task_id for ass in self.scheduling_output.assignments.get(amr.id, [])
+                         [:self.warm_start.frozen_length(amr.id)]]
+                for amr in self.data_input.amrs}
+
+
+def split_batches(data_input, size):
+    tasks = data_input.batches[0].tasks
+    data_input.batches = [Batch(i, tasks[start:start + size])
+                          for i, start in enumerate(range(0, len(tasks), size))]
+
+
+def test_untouched_amrs_keep_no_empty_route():
+    # more AMRs than tasks, so some AMRs never receive a task
+    data_input = DataInput('tasks_100_batchsize_None_C1_2_1.json', 'amrs_120.json')
+    scheduling_output = KeepSuffix().run(data_input)
+
+    assert all(len(route) > 0 for route in scheduling_output.assignments.values())
+
+    evaluation = Evaluation(data_input)
+    evaluation.evaluate(scheduling_output)
+    assert evaluation.total_makespan > 0
+
+
+def test_replaced_suffix_never_starts_before_release(data_input):
+    split_batches(data_input, 10)
+    release_time = min(task.time_window.earliest_start for task in data_input.batches[-1].tasks)
+
+    optimizer = ReverseSuffix()
+    scheduling_output = optimizer.run(data_input)
+
+    assert optimizer.warm_start.release_time == release_time
+
+    # rescheduled tasks must not move into the past and become frozen
+    for before, after in optimizer.frozen:
+        assert before == after
+
+    for route in scheduling_output.assignments.values():
+        for previous, assignment in zip(route, route[1:]):
+            assert assignment.start_time >= previous.start_time + previous.duration
+
+
+def test_rescheduled_task_starts_at_release(data_input):
+    scheduling_output = SchedulingOutput(data_input)
+    warm_start = WarmStart(scheduling_output, scheduling_output.cost_cache)
+
+    # task 1 may start at 19, but is still open when the next batch arrives at 200
+    scheduling_output.add_assignment(0, 0, 0)
+    scheduling_output.add_assignment(0, 1, 300)
+    warm_start.release_time = 200
+
+    warm_start.replace_suffix(0, [1])
+
+    prefix_end = scheduling_output.assignments[0][0].duration
+    assert prefix_end < 200
+    assert scheduling_output.assignments[0][1].start_time == 200
+    assert warm_start.open_suffix(0) == [1]